@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from Coloracion import Coloracion
+from Grafica import Grafica
+from Optimizacion_Cont import AlgoritmoGenetico, AlgoritmoGeneticoVectorizado, dominios, funciones
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+def grafica_aleatoria(vertices, grado_promedio, semilla=0):
+    """Genera una gráfica aleatoria con cierto grado promedio
+
+    Args:
+        vertices (int): Número de vértices
+        grado_promedio (int): Grado promedio esperado
+        semilla (int, optional): Semilla del generador. Defaults to 0.
+
+    Returns:
+        Coloracion: Instancia de Coloracion con la gráfica generada
+    """
+    generador = np.random.default_rng(semilla)
+    aristas = vertices * grado_promedio // 2
+    origen = generador.integers(0, vertices, aristas)
+    destino = generador.integers(0, vertices, aristas)
+    return Coloracion.desde_grafica(Grafica.desde_aristas(vertices, origen, destino))
+
+MUESTRAS = 5
+DURACION_MUESTRA = 0.05
+
+def mide(funcion, repeticiones=1, muestras=None):
+    """Mide el tiempo y la memoria máxima de una función. Las primeras
+        corridas son de calentamiento y sirven para aumentar repeticiones
+        hasta que cada muestra dure al menos DURACION_MUESTRA segundos;
+        después toma varias muestras y reporta la más rápida, la menos
+        afectada por el ruido del sistema, para que ese ruido no se confunda
+        con una regresión. La memoria se mide en
+        otra corrida aparte, con tracemalloc.
+
+    Args:
+        funcion (callable): Función sin argumentos a medir; debe reiniciar su propia semilla
+        repeticiones (int, optional): Mínimo de llamadas por muestra. Defaults to 1.
+        muestras (int, optional): Muestras de tiempo. Defaults to MUESTRAS.
+
+    Returns:
+        tuple: Segundos por llamada de la muestra más rápida, memoria máxima en bytes y el último resultado
+    """
+    muestras = MUESTRAS if muestras is None else muestras
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            funcion()
+        duracion = time.perf_counter() - inicio
+        if duracion >= DURACION_MUESTRA:
+            break
+        repeticiones *= max(2, min(10, int(DURACION_MUESTRA / max(duracion, 1e-9)) + 1))
+    tiempos = []
+    for _ in range(muestras):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            resultado = funcion()
+        tiempos.append((time.perf_counter() - inicio) / repeticiones)
+    segundos = float(np.min(tiempos))
+    tracemalloc.start()
+    funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return segundos, pico, resultado
+
+def con_semilla(funcion, objeto, semilla=0):
+    def envuelta():
+        objeto.generador = np.random.default_rng(semilla)
+        return funcion()
+    return envuelta
+
+def benchmark_evaluacion(nombre, coloracion, repeticiones, muestras=None):
+    colores = np.random.default_rng(0).integers(1, coloracion.vertices + 1, coloracion.vertices)
+    segundos, pico, _ = mide(lambda: coloracion.funcion_evaluacion(colores), repeticiones, muestras)
+    return {"nombre": f"evaluacion/{nombre}", "vertices": coloracion.vertices,
+            "aristas": coloracion.grafica.numero_aristas(), "segundos": segundos,
+            "evaluaciones_por_segundo": 1 / segundos, "memoria_pico": pico}
+
+def benchmark_busqueda(nombre, coloracion, busqueda, iteraciones, tamanio_poblacion=50, muestras=None):
+    ejecuciones = {
+        "aleatoria": lambda: coloracion.soluciones_aleatorias(iteraciones),
+        "escalada": lambda: coloracion.busqueda_escalada(iteraciones),
+        "iterada": lambda: coloracion.busqueda_local_iterada(iteraciones),
+        "tabu": lambda: coloracion.busqueda_tabu(iteraciones),
+        "genetica": lambda: coloracion.algoritmo_genetico(tamanio_poblacion, iteraciones),
+    }
+    coloracion.asigna_generador(1)
+    referencia = float(coloracion.evaluar_poblacion(coloracion.genera_poblacion_inicial(20)).mean())
+    segundos, pico, resultado = mide(con_semilla(ejecuciones[busqueda], coloracion), muestras=muestras)
+    mejor = float(resultado[1])
+    return {"nombre": f"{busqueda}/{nombre}", "vertices": coloracion.vertices, "iteraciones": iteraciones,
+            "segundos": segundos, "iteraciones_por_segundo": iteraciones / segundos,
+            "mejor_evaluacion": mejor, "mejora_por_segundo": (referencia - mejor) / segundos,
+            "memoria_pico": pico}
+
+def benchmark_funcion(nombre, funcion, tamanio, dimension, repeticiones, muestras=None):
+    poblacion = np.random.default_rng(0).uniform(-5, 5, (tamanio, dimension))
+    individuos = poblacion.tolist()
+    segundos_lote, pico, _ = mide(lambda: funcion(poblacion), repeticiones, muestras)
+    segundos_escalar, _, _ = mide(lambda: [funcion(x) for x in individuos], muestras=muestras)
+    return {"nombre": f"funcion/{nombre}", "dimension": dimension, "segundos": segundos_lote,
+            "evaluaciones_por_segundo": tamanio / segundos_lote,
+            "evaluaciones_por_segundo_escalar": tamanio / segundos_escalar, "memoria_pico": pico}
+
+def benchmark_genetico(nombre, clase, funcion, dominio, tamanio, dimension, generaciones, muestras=None):
+    ag = clase(funcion, dominio, tamano_poblacion=tamanio, num_generaciones=generaciones, dimension=dimension)
+    segundos, pico, resultado = mide(con_semilla(ag.ejecutar, ag), muestras=muestras)
+    return {"nombre": f"genetico/{nombre}", "tamano_poblacion": tamanio, "dimension": dimension,
+            "segundos": segundos, "generaciones_por_segundo": generaciones / segundos,
+            "mejor_evaluacion": float(resultado[2]), "memoria_pico": pico}
+
+def ejecuta_benchmarks(rapido=False, muestras=None):
+    """Ejecuta todos los benchmarks
+
+    Args:
+        rapido (bool, optional): Usar tamaños pequeños. Defaults to False.
+        muestras (int, optional): Muestras de tiempo por caso (se reporta la más rápida). Defaults to MUESTRAS.
+
+    Returns:
+        dict: Metadatos del equipo y lista de resultados
+    """
+    muestras = MUESTRAS if muestras is None else muestras
+    resultados = []
+    graficas = {"queen5_5": Coloracion.leer_archivo(os.path.join(RAIZ, "Grafo5.txt"), usar_cache=False),
+                "queen8_8": Coloracion.leer_archivo(os.path.join(RAIZ, "Grafo9.txt"), usar_cache=False)}
+    tamanios = (1000, 10000) if rapido else (1000, 10000, 100000)
+    for vertices in tamanios:
+        graficas[f"aleatoria_{vertices}"] = grafica_aleatoria(vertices, 20)
+    for nombre, coloracion in graficas.items():
+        resultados.append(benchmark_evaluacion(nombre, coloracion, 20 if rapido else 200, muestras))
+    iteraciones = 200 if rapido else 2000
+    for busqueda in ("aleatoria", "escalada", "iterada", "tabu", "genetica"):
+        for nombre in ("queen8_8", f"aleatoria_{tamanios[0]}"):
+            resultados.append(benchmark_busqueda(nombre, graficas[nombre], busqueda,
+                                                 iteraciones // 10 if busqueda == "genetica" else iteraciones,
+                                                 muestras=muestras))
+    for nombre, funcion in funciones.items():
+        resultados.append(benchmark_funcion(nombre, funcion, 1000, 30, 10 if rapido else 100, muestras))
+    generaciones = 10 if rapido else 50
+    for nombre in ("sphere", "rastrigin"):
+        resultados.append(benchmark_genetico(f"{nombre}/listas", AlgoritmoGenetico, funciones[nombre],
+                                             dominios[nombre], 100, 30, generaciones, muestras))
+        resultados.append(benchmark_genetico(f"{nombre}/vectorizado", AlgoritmoGeneticoVectorizado, funciones[nombre],
+                                             dominios[nombre], 1000, 30, generaciones, muestras))
+    return {"python": sys.version.split()[0], "numpy": np.__version__, "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"), "muestras": muestras, "resultados": resultados}
+
+def compara(actual, base, tolerancia):
+    """Compara las métricas de rendimiento (las que terminan en _por_segundo)
+        contra una ejecución guardada
+
+    Args:
+        actual (dict): Resultados actuales
+        base (dict): Resultados de referencia
+        tolerancia (float): Caída relativa permitida antes de marcar una regresión
+
+    Returns:
+        list(str): Descripción de cada regresión encontrada
+    """
+    referencia = {r["nombre"]: r for r in base["resultados"]}
+    regresiones = []
+    for resultado in actual["resultados"]:
+        anterior = referencia.get(resultado["nombre"])
+        if anterior is None:
+            continue
+        for metrica, valor in resultado.items():
+            if not metrica.endswith("_por_segundo") or metrica not in anterior or anterior[metrica] <= 0:
+                continue
+            cambio = valor / anterior[metrica] - 1
+            marca = "REGRESION" if cambio < -tolerancia else ""
+            print(f"{resultado['nombre']:<32} {metrica:<34} {anterior[metrica]:>14.1f} {valor:>14.1f} {cambio:>+8.1%} {marca}")
+            if marca:
+                regresiones.append(f"{resultado['nombre']} {metrica}: {cambio:+.1%}")
+    return regresiones
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de las búsquedas y funciones objetivo")
+    parser.add_argument("--salida", default="benchmark.json", help="Archivo JSON de resultados")
+    parser.add_argument("--comparar", default=None, help="JSON de una ejecución anterior para comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="Caída relativa permitida (0.2 = 20%%)")
+    parser.add_argument("--muestras", type=int, default=MUESTRAS,
+                        help="Muestras de tiempo por caso, después de un calentamiento; se compara la más rápida")
+    parser.add_argument("--rapido", action="store_true", help="Usar tamaños pequeños")
+    argumentos = parser.parse_args()
+    actual = ejecuta_benchmarks(argumentos.rapido, argumentos.muestras)
+    with open(argumentos.salida, 'w') as archivo:
+        json.dump(actual, archivo, indent=2)
+    print(f"Resultados en {argumentos.salida}")
+    if argumentos.comparar is not None:
+        with open(argumentos.comparar, 'r') as archivo:
+            regresiones = compara(actual, json.load(archivo), argumentos.tolerancia)
+        if regresiones:
+            print(f"{len(regresiones)} regresiones de rendimiento")
+            sys.exit(1)
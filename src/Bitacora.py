@@ -0,0 +1,112 @@
+import os
+import struct
+import time
+import numpy as np
+
+class BitacoraConvergencia:
+    """Registro de convergencia por generación: generación, mejor, peor,
+    promedio y tiempo transcurrido en segundos.
+
+    Los registros se acumulan en memoria y se escriben cuando se juntan
+    registros_por_escritura o pasan segundos_por_escritura desde la última
+    escritura. Con formato "txt" se escribe una línea por registro separada
+    por espacios; con formato "npy" se escribe un arreglo float64 de
+    (generaciones, 5) que se puede abrir con np.load(ruta, mmap_mode='r').
+    Con continuar=True se agregan registros a un archivo existente, para
+    reanudar una búsqueda desde un punto de control.
+    """
+
+    COLUMNAS = ("generacion", "mejor", "peor", "promedio", "tiempo")
+    TAMANIO_ENCABEZADO = 128
+
+    def __init__(self, ruta, formato=None, registros_por_escritura=1000, segundos_por_escritura=5.0, continuar=False):
+        self.ruta = ruta
+        self.formato = formato if formato is not None else ("npy" if ruta.endswith(".npy") else "txt")
+        self.registros_por_escritura = registros_por_escritura
+        self.segundos_por_escritura = segundos_por_escritura
+        self.pendientes = []
+        self.escritos = 0
+        self.inicio = time.perf_counter()
+        self.ultima_escritura = self.inicio
+        if self.formato not in ("npy", "txt"):
+            raise ValueError(f"Formato de bitácora desconocido: {self.formato}")
+        if continuar and os.path.exists(ruta):
+            self.archivo = open(ruta, 'r+b' if self.formato == "npy" else 'r+')
+            self.recorta(None)
+        elif self.formato == "npy":
+            self.archivo = open(ruta, 'wb')
+            self.archivo.write(self._encabezado(0))
+        else:
+            self.archivo = open(ruta, 'w')
+
+    def _encabezado(self, renglones):
+        diccionario = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({renglones}, {len(self.COLUMNAS)}), }}"
+        largo = self.TAMANIO_ENCABEZADO - 10
+        return b"\x93NUMPY\x01\x00" + struct.pack("<H", largo) + diccionario.ljust(largo - 1).encode("latin1") + b"\n"
+
+    def recorta(self, renglones):
+        """Descarta los registros escritos después de cierto renglón y deja
+            el archivo listo para seguir agregando
+
+        Args:
+            renglones (int): Renglones a conservar, None para conservarlos todos
+        """
+        self.escribe()
+        if self.formato == "npy":
+            ancho = 8 * len(self.COLUMNAS)
+            completos = (self.archivo.seek(0, os.SEEK_END) - self.TAMANIO_ENCABEZADO) // ancho
+            self.escritos = completos if renglones is None else min(renglones, completos)
+            self.archivo.seek(self.TAMANIO_ENCABEZADO + self.escritos * ancho)
+        else:
+            self.archivo.seek(0)
+            self.escritos = 0
+            while renglones is None or self.escritos < renglones:
+                posicion = self.archivo.tell()
+                if not self.archivo.readline().endswith("\n"):
+                    self.archivo.seek(posicion)
+                    break
+                self.escritos += 1
+            self.archivo.seek(self.archivo.tell())
+        self.archivo.truncate()
+
+    def registra(self, generacion, mejor, peor, promedio):
+        """Agrega el registro de una generación
+
+        Args:
+            generacion (int): Número de generación
+            mejor (float): Mejor evaluación de la generación
+            peor (float): Peor evaluación vista
+            promedio (float): Promedio de la población
+        """
+        ahora = time.perf_counter()
+        self.pendientes.append((generacion, mejor, peor, promedio, ahora - self.inicio))
+        if len(self.pendientes) >= self.registros_por_escritura or ahora - self.ultima_escritura >= self.segundos_por_escritura:
+            self.escribe()
+
+    def escribe(self):
+        """Escribe en el archivo los registros pendientes"""
+        if self.pendientes:
+            if self.formato == "npy":
+                self.archivo.write(np.asarray(self.pendientes, dtype='<f8').tobytes())
+            else:
+                self.archivo.write("".join(" ".join(str(valor) for valor in registro) + "\n" for registro in self.pendientes))
+            self.escritos += len(self.pendientes)
+            self.pendientes = []
+        self.archivo.flush()
+        self.ultima_escritura = time.perf_counter()
+
+    def cierra(self):
+        """Escribe los registros pendientes, completa el encabezado y cierra el archivo"""
+        if self.archivo.closed:
+            return
+        self.escribe()
+        if self.formato == "npy":
+            self.archivo.seek(0)
+            self.archivo.write(self._encabezado(self.escritos))
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cierra()
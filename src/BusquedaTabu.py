@@ -0,0 +1,144 @@
+import numpy as np
+
+class BusquedaTabu:
+    """Búsqueda tabú para k-coloración al estilo TabuCol.
+
+    Mantiene una tabla gamma de |V| x k donde gamma[v, c] es el número de
+    vecinos de v que tienen el color c. El cambio en conflictos al mover v
+    al color c es gamma[v, c] - gamma[v, color(v)], así que cada movimiento
+    se evalúa en O(1) y la tabla se actualiza en O(grado(v)). Los vértices
+    en conflicto se guardan ordenados y se actualizan sólo con los vecinos
+    del vértice movido, así que un movimiento no recorre todos los vértices.
+    Internamente los colores van de 0 a k-1. Los números aleatorios de la
+    elección entre empates y de la tenencia se piden al generador por bloques.
+    """
+
+    BLOQUE_ALEATORIOS = 1024
+
+    def __init__(self, grafica, tenencia_aleatoria=10, alfa=0.6, generador=None):
+        self.grafica = grafica
+        self.tenencia_aleatoria = tenencia_aleatoria
+        self.alfa = alfa
+        self.generador = np.random.default_rng(generador)
+
+    def tabla_gamma(self, colores, k):
+        """Construye la tabla gamma de una coloración
+
+        Args:
+            colores (array(int)): Color de cada vértice, de 0 a k-1
+            k (int): Número de colores
+
+        Returns:
+            array(array(int)): Tabla de |V| x k
+        """
+        n = self.grafica.vertices
+        gamma = np.zeros((n, k), dtype=np.int64)
+        np.add.at(gamma, (self.grafica.u, colores[self.grafica.v]), 1)
+        np.add.at(gamma, (self.grafica.v, colores[self.grafica.u]), 1)
+        return gamma
+
+    def busca(self, colores, k, iteraciones, al_mover=None, criterio=None):
+        """Busca una k-coloración sin conflictos partiendo de colores
+
+        Args:
+            colores (array(int)): Coloración inicial, de 0 a k-1
+            k (int): Número de colores permitidos
+            iteraciones (int): Máximo de movimientos a realizar
+            al_mover (callable, optional): Función llamada tras cada
+            movimiento con el número de conflictos y de colores usados
+            criterio (CriterioParo, optional): Criterio de paro; cada
+            vecino probado cuenta como una evaluación, cada mejora se
+            registra con su evaluación (dos veces los conflictos más los
+            lazos y los colores usados) y se revisa al inicio de cada
+            bloque de aleatorios. Defaults to None.
+
+        Returns:
+            tuple: Mejor coloración, sus conflictos, movimientos realizados
+            y vecinos probados; con menos de dos colores no hay movimientos
+            y se regresa la coloración inicial
+        """
+        n = self.grafica.vertices
+        colores = np.array(colores, dtype=np.int64)
+        gamma = self.tabla_gamma(colores, k)
+        tabu = np.zeros((n, k), dtype=np.int64)
+        todos = np.arange(n)
+        conflictos = int(gamma[todos, colores].sum()) // 2
+        if k < 2:
+            return colores, conflictos, 0, 0
+        # conflictos de cada vértice con su propio color y vértices que tienen alguno
+        propios = gamma[todos, colores]
+        en_conflicto = np.flatnonzero(propios > 0)
+        histograma = np.bincount(colores, minlength=k)
+        usados = int(np.count_nonzero(histograma))
+        mejor_colores = colores.copy()
+        mejor_conflictos = conflictos
+        mejor_evaluacion = 2 * conflictos + self.grafica.lazos + usados
+        # vecinos probados y movimientos sin mejora aún no pasados al criterio
+        probados = 0
+        pasos = 0
+        evaluados = 0
+        iteracion = 0
+        while iteracion < iteraciones and mejor_conflictos > 0:
+            if iteracion % self.BLOQUE_ALEATORIOS == 0:
+                if criterio is not None:
+                    criterio.cuenta(probados)
+                    criterio.registra(mejor_evaluacion, pasos)
+                    probados = pasos = 0
+                    if criterio.termina():
+                        break
+                aleatorios = self.generador.random((min(self.BLOQUE_ALEATORIOS, iteraciones - iteracion), 2))
+            eleccion, tenencia = aleatorios[iteracion % self.BLOQUE_ALEATORIOS]
+            actuales = colores[en_conflicto]
+            iteracion += 1
+            deltas = gamma[en_conflicto] - gamma[en_conflicto, actuales][:, None]
+            probados += en_conflicto.size * (k - 1)
+            evaluados += en_conflicto.size * (k - 1)
+            pasos += 1
+            permitidos = (tabu[en_conflicto] < iteracion) | (conflictos + deltas < mejor_conflictos)
+            permitidos[np.arange(en_conflicto.size), actuales] = False
+            if not permitidos.any():
+                permitidos[:] = True
+                permitidos[np.arange(en_conflicto.size), actuales] = False
+                if not permitidos.any():
+                    break
+            deltas = np.where(permitidos, deltas, np.iinfo(np.int64).max)
+            candidatos = np.flatnonzero(deltas == deltas.min())
+            fila, color = divmod(int(candidatos[int(eleccion * candidatos.size)]), k)
+            vertice = en_conflicto[fila]
+            anterior = colores[vertice]
+            conflictos += int(deltas[fila, color])
+            vecinos = self.grafica.vecinos(vertice)
+            gamma[vecinos, anterior] -= 1
+            gamma[vecinos, color] += 1
+            colores[vertice] = color
+            liberados = vecinos[colores[vecinos] == anterior]
+            propios[liberados] -= 1
+            liberados = liberados[propios[liberados] == 0]
+            nuevos = vecinos[colores[vecinos] == color]
+            propios[nuevos] += 1
+            nuevos = nuevos[propios[nuevos] == 1]
+            propios[vertice] = gamma[vertice, color]
+            if propios[vertice] == 0:
+                liberados = np.append(liberados, vertice)
+            # los vecinos vienen ordenados, así que en_conflicto sigue ordenado
+            if liberados.size:
+                en_conflicto = np.delete(en_conflicto, np.searchsorted(en_conflicto, liberados))
+            if nuevos.size:
+                en_conflicto = np.insert(en_conflicto, np.searchsorted(en_conflicto, nuevos), nuevos)
+            histograma[anterior] -= 1
+            histograma[color] += 1
+            usados += int(histograma[color] == 1) - int(histograma[anterior] == 0)
+            tabu[vertice, anterior] = iteracion + int(self.alfa * conflictos) + int(tenencia * self.tenencia_aleatoria)
+            if conflictos < mejor_conflictos:
+                mejor_conflictos = conflictos
+                mejor_colores = colores.copy()
+                mejor_evaluacion = 2 * conflictos + self.grafica.lazos + usados
+                if criterio is not None:
+                    criterio.registra(mejor_evaluacion, pasos)
+                    pasos = 0
+            if al_mover is not None:
+                al_mover(conflictos, usados)
+        if criterio is not None:
+            criterio.cuenta(probados)
+            criterio.registra(mejor_evaluacion, pasos)
+        return mejor_colores, mejor_conflictos, iteracion, evaluados
@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+class CacheEvaluaciones:
+    """Memoriza evaluaciones de soluciones con desalojo LRU.
+
+    La llave es el contenido del arreglo de colores (sus bytes como int64),
+    así que modificar la solución después de evaluarla no altera la entrada
+    guardada. Cuenta aciertos y fallos, y protege sus operaciones con un
+    candado para poder compartirse entre hilos.
+    """
+
+    def __init__(self, tamanio_maximo=10000):
+        self.tamanio_maximo = tamanio_maximo
+        self.entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.candado = threading.Lock()
+
+    @staticmethod
+    def llave(colores):
+        """Calcula la llave de una solución
+
+        Args:
+            colores (array(int)): Asignación de colores
+
+        Returns:
+            bytes: Bytes del arreglo como int64 contiguo
+        """
+        return np.ascontiguousarray(colores, dtype=np.int64).tobytes()
+
+    def obtiene(self, colores, evalua):
+        """Regresa la evaluación guardada de una solución o la calcula y la guarda
+
+        Args:
+            colores (array(int)): Asignación de colores
+            evalua (callable): Función que evalúa la solución si no está guardada
+
+        Returns:
+            int: Evaluación de la solución
+        """
+        llave = self.llave(colores)
+        with self.candado:
+            if llave in self.entradas:
+                self.entradas.move_to_end(llave)
+                self.aciertos += 1
+                return self.entradas[llave]
+            self.fallos += 1
+        evaluacion = evalua(colores)
+        with self.candado:
+            self.entradas[llave] = evaluacion
+            self.entradas.move_to_end(llave)
+            while len(self.entradas) > self.tamanio_maximo:
+                self.entradas.popitem(last=False)
+        return evaluacion
+
+    def obtiene_lote(self, poblacion, evalua_lote):
+        """Regresa las evaluaciones de una población consultando la cache
+            renglón por renglón; los renglones que faltan (una vez cada
+            solución distinta) se evalúan juntos y se guardan
+
+        Args:
+            poblacion (array(array(int))): Matriz con una solución por renglón
+            evalua_lote (callable): Función que evalúa una matriz de soluciones
+
+        Returns:
+            array(int): Evaluación de cada renglón
+        """
+        poblacion = np.ascontiguousarray(poblacion, dtype=np.int64)
+        llaves = [renglon.tobytes() for renglon in poblacion]
+        evaluaciones = np.empty(len(llaves), dtype=np.int64)
+        faltantes = {}
+        with self.candado:
+            for i, llave in enumerate(llaves):
+                if llave in self.entradas:
+                    self.entradas.move_to_end(llave)
+                    self.aciertos += 1
+                    evaluaciones[i] = self.entradas[llave]
+                elif llave in faltantes:
+                    self.aciertos += 1
+                    faltantes[llave].append(i)
+                else:
+                    self.fallos += 1
+                    faltantes[llave] = [i]
+        if not faltantes:
+            return evaluaciones
+        primeros = [indices[0] for indices in faltantes.values()]
+        nuevas = evalua_lote(poblacion[primeros])
+        with self.candado:
+            for (llave, indices), evaluacion in zip(faltantes.items(), nuevas.tolist()):
+                evaluaciones[indices] = evaluacion
+                self.entradas[llave] = evaluacion
+                self.entradas.move_to_end(llave)
+            while len(self.entradas) > self.tamanio_maximo:
+                self.entradas.popitem(last=False)
+        return evaluaciones
+
+    def tasa_aciertos(self):
+        """Proporción de consultas que se resolvieron con la cache
+
+        Returns:
+            float: Aciertos entre consultas totales
+        """
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def limpia(self):
+        """Elimina todas las entradas y reinicia los contadores"""
+        with self.candado:
+            self.entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
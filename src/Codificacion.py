@@ -1,3 +1,4 @@
+import numpy as np
 
 class Codificacion:
     @staticmethod
@@ -14,11 +15,7 @@ class Codificacion:
         Returns:
         * list: Lista de valores decodificados.
         """
-        valor_decod = []
-        for i in range(0, len(x_cod), nBit):
-            sub_codificacion = x_cod[i:i+nBit]
-            valor_decod.append(Codificacion.decodifica(sub_codificacion, nBit, a, b))
-        return valor_decod
+        return Codificacion.decodifica_matriz(x_cod, nBit, a, b).tolist()
 
     @staticmethod
     def codifica_vector(x, nBit, a, b):
@@ -60,8 +57,7 @@ class Codificacion:
         Returns:
         * float: Valor decodificado.
         """
-        numero_int = int(''.join(str(bit) for bit in sub_codificacion), 2)
-        return a + numero_int * (b - a) / ((2**nBit) - 1)
+        return float(Codificacion.decodifica_matriz(sub_codificacion, nBit, a, b)[0])
 
     @staticmethod
     def codifica(x, nBit, a, b):
@@ -77,9 +73,244 @@ class Codificacion:
         Returns:
         * list: Lista de bits resultante.
         """
-        valor = (x - a) / (b - a)
-        numero_int = int(valor * ((2**nBit) - 1))
-        return [int(bit) for bit in bin(numero_int)[2:].zfill(nBit)]
+        return Codificacion.codifica_matriz([x], nBit, a, b).tolist()
+
+    @staticmethod
+    def potencias(nBit):
+        """
+        Regresa el vector de potencias de dos, de la más significativa a la menos.
+
+        Args:
+        * nBit: Número de bits por gen (a lo más 64).
+
+        Returns:
+        * array: Vector uint64 [2^(nBit-1), ..., 2, 1].
+        """
+        return np.left_shift(np.uint64(1), np.arange(nBit - 1, -1, -1, dtype=np.uint64))
+
+    @staticmethod
+    def decodifica_matriz(bits, nBit, a, b, gray=False):
+        """
+        Decodifica una matriz de bits (un individuo por renglón) en una matriz
+        de valores reales, con un producto punto contra las potencias de dos.
+
+        Args:
+        * bits: Matriz (tamaño, dim*nBit) de ceros y unos, o un solo vector.
+        * nBit: Número de bits por gen (a lo más 64).
+        * a: Límite inferior del rango de valores a decodificar.
+        * b: Límite superior del rango de valores a decodificar.
+        * gray: Si los genes están en código Gray.
+
+        Returns:
+        * array: Matriz (tamaño, dim) de flotantes, o un vector si bits era un vector.
+        """
+        bits = np.asarray(bits, dtype=np.uint8)
+        if gray:
+            bits = Codificacion.gray_a_binario(bits, nBit)
+        forma = bits.shape[:-1] + (bits.shape[-1] // nBit, nBit)
+        enteros = bits.reshape(forma).astype(np.uint64) @ Codificacion.potencias(nBit)
+        return a + enteros.astype(np.float64) * (b - a) / ((2**nBit) - 1)
+
+    @staticmethod
+    def codifica_matriz(x, nBit, a, b, gray=False):
+        """
+        Codifica una matriz de valores reales (un individuo por renglón) en una
+        matriz de bits, la operación inversa de decodifica_matriz.
+
+        Args:
+        * x: Matriz (tamaño, dim) de valores, o un solo vector.
+        * nBit: Número de bits por gen (a lo más 64).
+        * a: Límite inferior del rango de valores a codificar.
+        * b: Límite superior del rango de valores a codificar.
+        * gray: Si los genes se deben regresar en código Gray.
+
+        Returns:
+        * array: Matriz uint8 (tamaño, dim*nBit), o un vector si x era un vector.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        maximo = (2**nBit) - 1
+        valor = np.clip((x - a) / (b - a), 0.0, 1.0)
+        enteros = np.minimum(np.trunc(valor * maximo), maximo).astype(np.uint64)
+        desplazamientos = np.arange(nBit - 1, -1, -1, dtype=np.uint64)
+        if gray:
+            enteros ^= enteros >> np.uint64(1)
+        bits = (enteros[..., None] >> desplazamientos) & np.uint64(1)
+        return bits.astype(np.uint8).reshape(x.shape[:-1] + (x.shape[-1] * nBit,))
+
+    @staticmethod
+    def binario_a_gray(bits, nBit):
+        """
+        Convierte cada gen de una matriz de bits de binario a código Gray.
+
+        Args:
+        * bits: Matriz (tamaño, dim*nBit) de ceros y unos.
+        * nBit: Número de bits por gen.
+
+        Returns:
+        * array: Matriz uint8 de la misma forma en código Gray.
+        """
+        bits = np.asarray(bits, dtype=np.uint8)
+        genes = bits.reshape(bits.shape[:-1] + (bits.shape[-1] // nBit, nBit))
+        gray = genes.copy()
+        gray[..., 1:] ^= genes[..., :-1]
+        return gray.reshape(bits.shape)
+
+    @staticmethod
+    def gray_a_binario(bits, nBit):
+        """
+        Convierte cada gen de una matriz de bits de código Gray a binario.
+
+        Args:
+        * bits: Matriz (tamaño, dim*nBit) de ceros y unos en código Gray.
+        * nBit: Número de bits por gen.
+
+        Returns:
+        * array: Matriz uint8 de la misma forma en binario.
+        """
+        bits = np.asarray(bits, dtype=np.uint8)
+        genes = bits.reshape(bits.shape[:-1] + (bits.shape[-1] // nBit, nBit))
+        return np.bitwise_xor.accumulate(genes, axis=-1).reshape(bits.shape)
+
+    @staticmethod
+    def empaqueta(bits):
+        """
+        Empaqueta una matriz de bits (un individuo por renglón) a 8 bits por
+        byte. Cada renglón se rellena con ceros hasta un múltiplo de 8 bytes
+        para que los operadores puedan trabajar con palabras de 64 bits.
+
+        Args:
+        * bits: Matriz (tamaño, longitud) de ceros y unos.
+
+        Returns:
+        * array: Matriz uint8 (tamaño, 8*palabras).
+        """
+        empaquetado = np.packbits(np.asarray(bits, dtype=np.uint8), axis=-1)
+        relleno = (-empaquetado.shape[-1]) % 8
+        if relleno:
+            ceros = np.zeros(empaquetado.shape[:-1] + (relleno,), dtype=np.uint8)
+            empaquetado = np.concatenate((empaquetado, ceros), axis=-1)
+        return np.ascontiguousarray(empaquetado)
+
+    @staticmethod
+    def desempaqueta(empaquetado, longitud):
+        """
+        Recupera la matriz de bits de un genoma empaquetado.
+
+        Args:
+        * empaquetado: Matriz uint8 generada por empaqueta.
+        * longitud: Número de bits por individuo.
+
+        Returns:
+        * array: Matriz uint8 (tamaño, longitud) de ceros y unos.
+        """
+        return np.unpackbits(empaquetado, axis=-1, count=longitud)
+
+    @staticmethod
+    def decodifica_empaquetado(empaquetado, nBit, dim, a, b, gray=False):
+        """
+        Decodifica una población empaquetada en una matriz de valores reales.
+
+        Args:
+        * empaquetado: Matriz uint8 generada por empaqueta.
+        * nBit: Número de bits por gen.
+        * dim: Número de genes por individuo.
+        * a: Límite inferior del rango de valores a decodificar.
+        * b: Límite superior del rango de valores a decodificar.
+        * gray: Si los genes están en código Gray.
+
+        Returns:
+        * array: Matriz (tamaño, dim) de flotantes.
+        """
+        bits = Codificacion.desempaqueta(empaquetado, dim * nBit)
+        return Codificacion.decodifica_matriz(bits, nBit, a, b, gray)
+
+    @staticmethod
+    def mutacion_empaquetada(empaquetado, longitud, prob, generador=None):
+        """
+        Invierte cada bit con probabilidad aproximada prob directamente sobre
+        el genoma empaquetado. Sólo se sortean las posiciones que cambian
+        (con reemplazo, por lo que una posición repetida se invierte dos
+        veces), así que el costo es proporcional al número de bits invertidos.
+
+        Args:
+        * empaquetado: Matriz uint8 generada por empaqueta; se modifica en su lugar.
+        * longitud: Número de bits por individuo.
+        * prob: Probabilidad de invertir cada bit.
+        * generador: Generator o semilla de NumPy; None crea uno nuevo.
+
+        Returns:
+        * array: La misma matriz, mutada.
+        """
+        tamanio, bytes_por_renglon = empaquetado.shape
+        generador = np.random.default_rng(generador)
+        cantidad = generador.binomial(tamanio * longitud, prob)
+        posiciones = generador.integers(0, tamanio * longitud, size=cantidad)
+        renglon, bit = np.divmod(posiciones, longitud)
+        mascaras = np.left_shift(1, 7 - bit % 8).astype(np.uint8)
+        np.bitwise_xor.at(empaquetado.reshape(-1), renglon * bytes_por_renglon + bit // 8, mascaras)
+        return empaquetado
+
+    @staticmethod
+    def cruza_mascara_empaquetada(padres1, padres2, mascaras):
+        """
+        Cruza dos poblaciones empaquetadas con una máscara por pareja,
+        operando por palabras de 64 bits: donde la máscara vale 1 el primer
+        hijo toma el bit del primer padre.
+
+        Args:
+        * padres1: Matriz uint8 empaquetada de los primeros padres.
+        * padres2: Matriz uint8 empaquetada de los segundos padres.
+        * mascaras: Matriz uint8 empaquetada con la máscara de cada pareja.
+
+        Returns:
+        * tuple: Matrices empaquetadas de ambos hijos.
+        """
+        p1 = padres1.view(np.uint64)
+        p2 = padres2.view(np.uint64)
+        m = mascaras.view(np.uint64)
+        hijos1 = (p1 & m) | (p2 & ~m)
+        hijos2 = (p2 & m) | (p1 & ~m)
+        return hijos1.view(np.uint8), hijos2.view(np.uint8)
+
+    @staticmethod
+    def cruza_un_punto_empaquetada(padres1, padres2, longitud, generador=None):
+        """
+        Cruza de un punto sobre poblaciones empaquetadas: cada pareja
+        intercambia los bits a partir de un punto aleatorio.
+
+        Args:
+        * padres1: Matriz uint8 empaquetada de los primeros padres.
+        * padres2: Matriz uint8 empaquetada de los segundos padres.
+        * longitud: Número de bits por individuo.
+        * generador: Generator o semilla de NumPy; None crea uno nuevo.
+
+        Returns:
+        * tuple: Matrices empaquetadas de ambos hijos.
+        """
+        tamanio, bytes_por_renglon = padres1.shape
+        puntos = np.random.default_rng(generador).integers(1, longitud, size=tamanio)[:, None]
+        completos, resto = np.divmod(puntos, 8)
+        byte = np.arange(bytes_por_renglon)[None, :]
+        parcial = (0xFF00 >> resto) & 0xFF
+        mascaras = np.where(byte < completos, 0xFF, np.where(byte == completos, parcial, 0)).astype(np.uint8)
+        return Codificacion.cruza_mascara_empaquetada(padres1, padres2, mascaras)
+
+    @staticmethod
+    def cruza_uniforme_empaquetada(padres1, padres2, generador=None):
+        """
+        Cruza uniforme sobre poblaciones empaquetadas: cada bit de los hijos
+        viene de cualquiera de los padres con la misma probabilidad.
+
+        Args:
+        * padres1: Matriz uint8 empaquetada de los primeros padres.
+        * padres2: Matriz uint8 empaquetada de los segundos padres.
+        * generador: Generator o semilla de NumPy; None crea uno nuevo.
+
+        Returns:
+        * tuple: Matrices empaquetadas de ambos hijos.
+        """
+        mascaras = np.random.default_rng(generador).integers(0, 256, size=padres1.shape, dtype=np.uint8)
+        return Codificacion.cruza_mascara_empaquetada(padres1, padres2, mascaras)
 
     @staticmethod
     def float_a_binario(float_num):
@@ -1,43 +1,167 @@
+import argparse
+import warnings
 import numpy as np
-import sys
+import Nucleos
+from Bitacora import BitacoraConvergencia
+from BusquedaTabu import BusquedaTabu
+from CacheEvaluaciones import CacheEvaluaciones
+from Constructivas import Constructivas
+from CriterioParo import CriterioParo
+from EvaluadorIncremental import EvaluadorIncremental
 from Graficacion import Graficacion
+from Instrumentacion import NULA, Instrumentacion, perfila
+from LectorDIMACS import LectorDIMACS
+from Nucleos import FlujoMovimientos
+from Preprocesamiento import Preprocesamiento
+from PuntoControl import PuntoControl
+from Seleccion import Seleccion
 
 class Coloracion:
 
+    # búsquedas que guardan y reanudan puntos de control
+    BUSQUEDAS_CON_PUNTO_CONTROL = ("escalada", "iterada", "genetica")
+
     def __init__(self):
         self.grafica = None
         self.vertices = 0
         self.aristas = 0
+        self.cache = None
+        self.instrumentacion = NULA
+        self.generador = np.random.default_rng()
+        self.inicializacion = "aleatoria"
+        self._buffers = {}
+        self.backend = "numpy"
+        self.criterio = CriterioParo()
+        self.preprocesamiento = None
+        self.original = None
+
+    def activa_cache(self, tamanio_maximo):
+        """ Activa la memorización de evaluaciones en funcion_evaluacion
+
+        Args:
+            tamanio_maximo (int): Máximo de soluciones guardadas; 0 desactiva la cache
+        """
+        self.cache = CacheEvaluaciones(tamanio_maximo) if tamanio_maximo > 0 else None
+
+    def asigna_generador(self, generador):
+        """ Fija el generador de números aleatorios de todas las búsquedas
+
+        Args:
+            generador (Generator): Generador de NumPy, semilla o SeedSequence;
+            None crea uno nuevo con entropía del sistema
+        """
+        self.generador = np.random.default_rng(generador)
+
+    def asigna_backend(self, backend):
+        """ Elige cómo se ejecutan la evaluación y los ciclos de escalada y
+            búsqueda local iterada: numpy o numba (núcleos compilados). Si
+            numba no está instalado se usa numpy con una advertencia. Ambos
+            dan los mismos resultados con la misma semilla.
+
+        Args:
+            backend (str): numpy o numba
+
+        Raises:
+            ValueError: Si el backend no existe
+        """
+        if backend not in Nucleos.BACKENDS:
+            raise ValueError(f"Backend desconocido: {backend}")
+        if backend == "numba" and not Nucleos.NUMBA_DISPONIBLE:
+            warnings.warn("numba no está instalado; se usa el backend numpy")
+            backend = "numpy"
+        self.backend = backend
+
+    def reduce(self, colores=None, dominados=True):
+        """ Preprocesa la gráfica (ver Preprocesamiento) y regresa una
+            coloración sobre la gráfica reducida, con la misma configuración
+            y con la cota del clique como objetivo de su criterio de paro
+
+        Args:
+            colores (int, optional): Número de colores objetivo. Defaults to la cota del clique.
+            dominados (bool, optional): Eliminar también los vértices dominados. Defaults to True.
+
+        Returns:
+            Coloracion: Coloración de la gráfica reducida
+        """
+        preprocesamiento = Preprocesamiento(self.grafica, colores, dominados=dominados)
+        reducida = Coloracion.desde_grafica(preprocesamiento.reducida)
+        reducida.cache = None if self.cache is None else CacheEvaluaciones(self.cache.tamanio_maximo)
+        reducida.instrumentacion = self.instrumentacion
+        reducida.generador = self.generador
+        reducida.inicializacion = self.inicializacion
+        reducida.backend = self.backend
+        reducida.criterio = self.criterio.con_objetivo(preprocesamiento.evaluacion_minima())
+        reducida.preprocesamiento = preprocesamiento
+        reducida.original = self
+        return reducida
+
+    def solucion_original(self, colores, evaluacion):
+        """ Expande una solución de la gráfica reducida a la gráfica original
+            y la evalúa ahí; sin preprocesamiento la regresa igual
+
+        Args:
+            colores (array(int)): Solución encontrada
+            evaluacion (int): Su evaluación
+
+        Returns:
+            tuple: Solución y evaluación en la gráfica original
+        """
+        if self.preprocesamiento is None:
+            return colores, evaluacion
+        colores = self.preprocesamiento.expande(colores)
+        return colores, self.original.evalua(colores)
+
+    def solucion_inicial(self, generador=None):
+        """ Genera una solución inicial según self.inicializacion: aleatoria
+            (un color al azar por vértice), grado, dsatur, rlf o mixta (una de
+            las tres heurísticas constructivas elegida al azar)
+
+        Args:
+            generador (Generator, optional): Generador a usar en lugar de self.generador. Defaults to None.
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        generador = self.generador if generador is None else generador
+        if self.inicializacion == "aleatoria":
+            return generador.integers(1, self.vertices+1, self.vertices)
+        metodo = self.inicializacion
+        if metodo == "mixta":
+            metodo = Constructivas.METODOS[int(generador.integers(len(Constructivas.METODOS)))]
+        return Constructivas.colorea(metodo, self.grafica, generador)
         
     @staticmethod
-    def leer_archivo(archivo):
+    def leer_archivo(archivo, usar_cache=True):
         """ Función que genera una instancia de Coloracion
             a partir de leer un archivo en el que describe
             una gráfica.
 
         Args:
             archivo (string): nombre del archivo a leer
+            usar_cache (bool, optional): Usar la cache binaria de la gráfica. Defaults to True.
 
         Returns:
             Coloracion: Instancia de la clase Coloracion con
             la gráfica descrita en el archivo
         """
+        grafica, aristas = LectorDIMACS.lee(archivo, usar_cache)
+        return Coloracion.desde_grafica(grafica, aristas)
+
+    @staticmethod
+    def desde_grafica(grafica, aristas=None):
+        """ Genera una instancia de Coloracion a partir de una gráfica ya construida
+
+        Args:
+            grafica (Grafica): Gráfica en formato CSR
+            aristas (int, optional): Aristas declaradas. Defaults to las aristas distintas de la gráfica.
+
+        Returns:
+            Coloracion: Instancia de la clase Coloracion con la gráfica dada
+        """
         coloracion = Coloracion()
-        with open(archivo, 'r') as datos:
-            for linea in datos:
-                cadena = linea.strip().split()
-                if cadena[0] == 'c':
-                    continue
-                elif cadena[0] == 'p':
-                    n = int(cadena[2])
-                    coloracion.vertices = n
-                    coloracion.aristas = int(cadena[3])
-                    coloracion.grafica = [[0] * n for _ in range(n)]
-                elif cadena[0] == 'e':
-                    i = int(cadena[1]) - 1
-                    j = int(cadena[2]) - 1
-                    coloracion.grafica[i][j] = 1
-                    coloracion.grafica[j][i] = 1
+        coloracion.grafica = grafica
+        coloracion.vertices = grafica.vertices
+        coloracion.aristas = grafica.numero_aristas() if aristas is None else aristas
         return coloracion
 
     def funcion_evaluacion(self, colores):
@@ -51,19 +175,67 @@ class Coloracion:
             de color a cada vértice
 
         Returns:
-            int: 
+            int: Dos veces el número de aristas en conflicto más
+            el número de colores distintos usados
+        """
+        self.instrumentacion.cuenta("evaluaciones")
+        self.criterio.cuenta()
+        if self.cache is not None:
+            return self.cache.obtiene(colores, self.evalua)
+        return self.evalua(colores)
+
+    def evalua(self, colores):
+        """ Evalúa una solución sin consultar la cache
+
+        Args:
+            colores (array(int)): Arreglo con las asignaciones
+            de color a cada vértice
+
+        Returns:
+            int: Evaluación de la solución
+        """
+        colores = np.asarray(colores)
+        if self.backend == "numba":
+            return int(Nucleos.evalua(self.grafica.u, self.grafica.v, colores, self.vertices, self.grafica.lazos))
+        conflictos = np.count_nonzero(colores[self.grafica.u] == colores[self.grafica.v])
+        usados = np.bincount(colores, minlength=self.vertices + 1)[1:self.vertices + 1]
+        return int(2 * conflictos + self.grafica.lazos + np.count_nonzero(usados))
+
+    def evaluar_poblacion(self, poblacion):
+        """ Evalúa a toda una población en una sola pasada,
+            con el mismo criterio que funcion_evaluacion.
+
+        Args:
+            poblacion (array(array(int))): Matriz (tamaño, vertices)
+            con una solución por renglón
+
+        Returns:
+            array(int): Evaluación de cada individuo
+        """
+        poblacion = np.asarray(poblacion)
+        tamanio = poblacion.shape[0]
+        self.instrumentacion.cuenta("evaluaciones", tamanio)
+        self.criterio.cuenta(tamanio)
+        if self.cache is not None:
+            return self.cache.obtiene_lote(poblacion, self.evalua_poblacion)
+        return self.evalua_poblacion(poblacion)
+
+    def evalua_poblacion(self, poblacion):
+        """ Evalúa una población sin consultar la cache
+
+        Args:
+            poblacion (array(array(int))): Matriz (tamaño, vertices)
+            con una solución por renglón
+
+        Returns:
+            array(int): Evaluación de cada individuo
         """
-        calificacion = 0
-        for i in range(self.vertices):
-            for j in range(self.vertices):
-                if self.grafica[i][j] == 1 and colores[i] == colores[j]:
-                    calificacion += 1
-        for i in range(self.vertices):
-            for j in range(len(colores)):
-                if colores[j] == i+1:
-                    calificacion += 1
-                    break
-        return calificacion
+        tamanio = poblacion.shape[0]
+        conflictos = np.count_nonzero(poblacion[:, self.grafica.u] == poblacion[:, self.grafica.v], axis=1)
+        desplazamiento = np.arange(tamanio)[:, None] * (self.vertices + 1)
+        usados = np.bincount((poblacion + desplazamiento).ravel(), minlength=tamanio * (self.vertices + 1))
+        usados = usados.reshape(tamanio, self.vertices + 1)[:, 1:]
+        return 2 * conflictos + self.grafica.lazos + np.count_nonzero(usados, axis=1)
     
     def soluciones_aleatorias(self, iteraciones=10):
         """ Función para generar soluciones aleatorias
@@ -75,308 +247,646 @@ class Coloracion:
         Returns:
             (array(int)): Arreglo con la mejor solucion generada aleatoriamente
         """
-        mejor_solucion = np.random.randint(1, self.vertices+1, self.vertices)
-        promedio = self.funcion_evaluacion(mejor_solucion)
+        criterio = self.criterio
+        criterio.inicia()
+        mejor_solucion = self.generador.integers(1, self.vertices+1, self.vertices)
+        mejor_evaluacion = self.funcion_evaluacion(mejor_solucion)
+        criterio.registra(mejor_evaluacion)
+        promedio = mejor_evaluacion
         peor = 0
-        for _ in range(iteraciones):
-            solucion_actual = np.random.randint(1,self.vertices+1,self.vertices)
-            if self.funcion_evaluacion(solucion_actual) <= self.funcion_evaluacion(mejor_solucion):
+        bloque = max(1, min(64, 2**20 // max(self.vertices, 1)))
+        for i in range(iteraciones):
+            if criterio.termina():
+                iteraciones = i
+                break
+            if i % bloque == 0:
+                soluciones = self.generador.integers(1, self.vertices+1, (min(bloque, iteraciones - i), self.vertices))
+            solucion_actual = soluciones[i % bloque]
+            evaluacion = self.funcion_evaluacion(solucion_actual)
+            if evaluacion <= mejor_evaluacion:
                 mejor_solucion = solucion_actual
-            elif peor < self.funcion_evaluacion(solucion_actual):
-                peor = self.funcion_evaluacion(solucion_actual)
-            promedio += self.funcion_evaluacion(solucion_actual)
-        return mejor_solucion, self.funcion_evaluacion(mejor_solucion), peor, promedio/iteraciones
+                mejor_evaluacion = evaluacion
+            elif peor < evaluacion:
+                peor = evaluacion
+            promedio += evaluacion
+            criterio.registra(mejor_evaluacion)
+        return mejor_solucion, mejor_evaluacion, peor, promedio/max(iteraciones, 1)
     
-    def funcion_vecindad(self, solucion_actual):
-        """ Funcion que selecciona al primer vecino "mejorado"
+    def funcion_vecindad(self, evaluador, intentos=None, flujo=None):
+        """ Funcion que aplica el primer movimiento que no empeora la solucion.
+            Cada movimiento se evalúa en O(grado(v)) con el evaluador incremental.
 
         Args:
-            solucion_actual (array(int)): Arreglo con la solucion actual
+            evaluador (EvaluadorIncremental): Solucion actual con su evaluacion
+            intentos (int, optional): Máximo de vecinos a revisar. Defaults to el del criterio de paro.
+            flujo (FlujoMovimientos, optional): Movimientos sorteados de la búsqueda. Defaults to uno nuevo.
 
         Returns:
-            array(int): Regresa al mejor vecino encontrado
+            tuple: Movimiento aplicado (vertice, color anterior) o None si
+            no se encontró un vecino que no empeore
         """
-        vecino = self.obtener_vecino(solucion_actual)
-        while self.funcion_evaluacion(vecino) > self.funcion_evaluacion(solucion_actual):
-            vecino = self.obtener_vecino(solucion_actual)
-        return vecino
+        if intentos is None:
+            intentos = self.criterio.intentos(self.vertices)
+        if flujo is None:
+            flujo = FlujoMovimientos(self.generador, self.vertices, 16)
+        probados = 0
+        bloque = 16
+        while probados < intentos:
+            indices, nuevos_colores = flujo.pendientes(min(bloque, intentos - probados))
+            for k, (indice, nuevo_color) in enumerate(zip(indices.tolist(), nuevos_colores.tolist())):
+                if evaluador.delta(indice, nuevo_color) <= 0:
+                    flujo.avanza(k + 1)
+                    self.criterio.cuenta(probados + k + 1)
+                    self.instrumentacion.cuenta("movimientos_probados", probados + k + 1)
+                    self.instrumentacion.cuenta("movimientos_aceptados")
+                    return indice, evaluador.aplica(indice, nuevo_color)
+            flujo.avanza(len(indices))
+            probados += len(indices)
+            bloque *= 2
+        self.criterio.cuenta(probados)
+        self.instrumentacion.cuenta("movimientos_probados", probados)
+        return None
     
-    def obtener_vecino(self, solucion_actual):
-        """ Obtiene un vecino de la solucion actual
-
-        Args:
-            solucion_actual (array(int)): Arreglo con la solucion actual
-            
-        Returns:
-            array(int): Arreglo de la solucion actual con una mutacion
-        """
-        nuevo_color = np.random.randint(1, self.vertices+1)
-        indice = np.random.randint(0, len(solucion_actual))
-        solucion_actual[indice] = nuevo_color
-        return solucion_actual
+    def _lote_iteraciones(self, punto_control):
+        """Iteraciones entre revisiones del punto de control y del reloj del criterio de paro"""
+        if punto_control is None and self.criterio.segundos is None:
+            return None
+        return 1 if self.backend == "numpy" else 1024
+
+    def _paro_nucleo(self, progreso):
+        """Criterio de paro para los núcleos compilados: objetivo (-1 si no
+            hay), límite de movimientos probados, máximo de iteraciones sin
+            mejora, mejor evaluación e iteraciones sin mejora"""
+        criterio = self.criterio
+        sin_limite = np.iinfo(np.int64).max
+        restantes = criterio.restantes()
+        return np.array([-1 if criterio.objetivo is None else int(np.floor(criterio.objetivo)),
+                         sin_limite if restantes is None else int(progreso[-2]) + restantes,
+                         sin_limite if criterio.sin_mejora is None else criterio.sin_mejora,
+                         criterio.mejor, criterio.pasos_sin_mejora], dtype=np.int64)
+
+    def _sincroniza_criterio(self, paro, progreso, probados):
+        """Pasa al criterio de paro lo que avanzó un núcleo compilado"""
+        self.criterio.cuenta(int(progreso[-2]) - probados)
+        self.criterio.mejor, self.criterio.pasos_sin_mejora = int(paro[3]), int(paro[4])
+
+    def _cuenta_movimientos(self, progreso, antes):
+        self.instrumentacion.cuenta("movimientos_probados", int(progreso[-2] - antes[0]))
+        self.instrumentacion.cuenta("movimientos_aceptados", int(progreso[-1] - antes[1]))
     
-    def busqueda_escalada(self, iteraciones=1000):
+    def busqueda_escalada(self, iteraciones=1000, punto_control=None):
         """ Funcion para realizar una busqueda por escalada 
 
         Args:
             iteraciones (int, optional): Iteraciones para la busqueda por escalada. Defaults to 1000.
+            punto_control (PuntoControl, optional): Guarda el estado periódicamente y permite reanudar. Defaults to None.
 
         Returns:
             array(int): Arreglo con la mejor solucion encontrada
         """
-        mejor_solucion = np.random.randint(1, self.vertices+1, self.vertices)
-        promedio = self.funcion_evaluacion(mejor_solucion)
-        peor = promedio
-        for _ in range(iteraciones):
-            mejor_solucion = self.funcion_vecindad(mejor_solucion)
-            evaluacion = self.funcion_evaluacion(mejor_solucion)
+        estado = None if punto_control is None else punto_control.reanuda("escalada", self.generador)
+        flujo = FlujoMovimientos(self.generador, self.vertices)
+        criterio = self.criterio
+        criterio.inicia()
+        if estado is None:
+            evaluador = EvaluadorIncremental(self.grafica, self.solucion_inicial())
+            evaluacion = evaluador.evaluacion
+            # iteración, peor, suma de evaluaciones, movimientos probados y aceptados
+            progreso = np.array([0, evaluacion, evaluacion, 0, 0], dtype=np.int64)
+            criterio.registra(evaluacion)
+        else:
+            evaluador = EvaluadorIncremental(self.grafica, estado["colores"])
+            progreso = np.array(estado["progreso"], dtype=np.int64)
+            flujo.restaura(estado["movimientos"])
+            criterio.restaura(estado["criterio"])
+        def datos():
+            return {"colores": evaluador.colores, "progreso": progreso, "movimientos": flujo.estado(),
+                    "criterio": criterio.estado()}
+        lote = self._lote_iteraciones(punto_control)
+        while progreso[0] < iteraciones and not criterio.termina():
+            hasta = iteraciones if lote is None else min(iteraciones, int(progreso[0]) + lote)
+            self._avanza_escalada(evaluador, flujo, progreso, hasta)
+            if punto_control is not None:
+                punto_control.revisa("escalada", datos, self.generador)
+        if punto_control is not None:
+            punto_control.guarda("escalada", datos(), self.generador)
+        return evaluador.colores, evaluador.evaluacion, int(progreso[1]), int(progreso[2])/max(int(progreso[0]), 1)
+
+    def _avanza_escalada(self, evaluador, flujo, progreso, hasta):
+        """Realiza las iteraciones de la escalada hasta la iteración hasta,
+            con el backend elegido"""
+        criterio = self.criterio
+        intentos = criterio.intentos(self.vertices)
+        if self.backend == "numba":
+            totales = np.array([evaluador.aristas_conflicto, evaluador.colores_usados], dtype=np.int64)
+            antes = progreso[-2:].copy()
+            while progreso[0] < hasta and not criterio.termina():
+                if flujo.disponibles() < intentos:
+                    flujo.asegura(2 * intentos)
+                paro, probados = self._paro_nucleo(progreso), int(progreso[-2])
+                flujo.posicion = Nucleos.escalada(self.grafica.indptr, self.grafica.indices, evaluador.colores,
+                                                  evaluador.histograma, evaluador.conflictos, totales,
+                                                  self.grafica.lazos, flujo.movimientos, flujo.posicion,
+                                                  hasta, intentos, paro, progreso)
+                self._sincroniza_criterio(paro, progreso, probados)
+            evaluador.aristas_conflicto, evaluador.colores_usados = int(totales[0]), int(totales[1])
+            self._cuenta_movimientos(progreso, antes)
+            return
+        iteracion, peor, suma = int(progreso[0]), int(progreso[1]), int(progreso[2])
+        while iteracion < hasta and not criterio.termina():
+            self.funcion_vecindad(evaluador, intentos, flujo)
+            evaluacion = evaluador.evaluacion
             if peor < evaluacion:
                 peor = evaluacion
-            promedio += evaluacion
-        return mejor_solucion, self.funcion_evaluacion(mejor_solucion), peor, promedio/iteraciones
+            suma += evaluacion
+            iteracion += 1
+            criterio.registra(evaluacion)
+        progreso[:3] = iteracion, peor, suma
     
-    def  busqueda_local_iterada(self, iteraciones=1000):
-        """ Funcion para realizar una busqueda local iterada
+    def  busqueda_local_iterada(self, iteraciones=1000, punto_control=None):
+        """ Funcion para realizar una busqueda local iterada. Los movimientos
+            de una iteración rechazada se deshacen en lugar de copiar la solución.
 
         Args:
             iteraciones (int, optional): Iteraciones para la búsqueda local iterada. Defaults to 1000.
+            punto_control (PuntoControl, optional): Guarda el estado periódicamente y permite reanudar. Defaults to None.
 
         Returns:
             array(int): Arreglo con la mejor solución encontrada
         """
-        mejor_solucion = np.random.randint(1, self.vertices+1, self.vertices)
-        promedio = self.funcion_evaluacion(mejor_solucion)
-        peor = promedio
-        for _ in range(iteraciones):
-            solucion_modificada = self.perturbacion(mejor_solucion)
-            mejor_solucion_local = self.funcion_vecindad(solucion_modificada)
-            evaluacion_actual = self.funcion_evaluacion(mejor_solucion_local)
-            if evaluacion_actual <= self.funcion_evaluacion(mejor_solucion):
-                mejor_solucion = mejor_solucion_local
-            elif peor < evaluacion_actual:
-                peor = evaluacion_actual
-            promedio += evaluacion_actual
-        return mejor_solucion, self.funcion_evaluacion(mejor_solucion), peor, promedio/iteraciones
+        estado = None if punto_control is None else punto_control.reanuda("iterada", self.generador)
+        flujo = FlujoMovimientos(self.generador, self.vertices)
+        criterio = self.criterio
+        criterio.inicia()
+        if estado is None:
+            evaluador = EvaluadorIncremental(self.grafica, self.solucion_inicial())
+            evaluacion = evaluador.evaluacion
+            # iteración, mejor, peor, suma de evaluaciones, movimientos probados y aceptados
+            progreso = np.array([0, evaluacion, evaluacion, evaluacion, 0, 0], dtype=np.int64)
+            criterio.registra(evaluacion)
+        else:
+            evaluador = EvaluadorIncremental(self.grafica, estado["colores"])
+            progreso = np.array(estado["progreso"], dtype=np.int64)
+            flujo.restaura(estado["movimientos"])
+            criterio.restaura(estado["criterio"])
+        def datos():
+            return {"colores": evaluador.colores, "progreso": progreso, "movimientos": flujo.estado(),
+                    "criterio": criterio.estado()}
+        lote = self._lote_iteraciones(punto_control)
+        while progreso[0] < iteraciones and not criterio.termina():
+            hasta = iteraciones if lote is None else min(iteraciones, int(progreso[0]) + lote)
+            self._avanza_iterada(evaluador, flujo, progreso, hasta)
+            if punto_control is not None:
+                punto_control.revisa("iterada", datos, self.generador)
+        if punto_control is not None:
+            punto_control.guarda("iterada", datos(), self.generador)
+        return evaluador.colores, int(progreso[1]), int(progreso[2]), int(progreso[3])/max(int(progreso[0]), 1)
+
+    def _avanza_iterada(self, evaluador, flujo, progreso, hasta):
+        """Realiza las iteraciones de la búsqueda local iterada hasta la
+            iteración hasta, con el backend elegido"""
+        criterio = self.criterio
+        intentos = criterio.intentos(self.vertices)
+        cantidad = int(self.vertices/10) + 1
+        if self.backend == "numba":
+            totales = np.array([evaluador.aristas_conflicto, evaluador.colores_usados], dtype=np.int64)
+            deshacer = np.empty((cantidad + 1, 2), dtype=np.int64)
+            antes = progreso[-2:].copy()
+            while progreso[0] < hasta and not criterio.termina():
+                if flujo.disponibles() < cantidad + intentos:
+                    flujo.asegura(2 * (cantidad + intentos))
+                paro, probados = self._paro_nucleo(progreso), int(progreso[-2])
+                flujo.posicion = Nucleos.iterada(self.grafica.indptr, self.grafica.indices, evaluador.colores,
+                                                 evaluador.histograma, evaluador.conflictos, totales,
+                                                 self.grafica.lazos, flujo.movimientos, flujo.posicion,
+                                                 hasta, cantidad, intentos, paro, progreso, deshacer)
+                self._sincroniza_criterio(paro, progreso, probados)
+            evaluador.aristas_conflicto, evaluador.colores_usados = int(totales[0]), int(totales[1])
+            self._cuenta_movimientos(progreso, antes)
+            return
+        iteracion, mejor_evaluacion, peor, suma = (int(x) for x in progreso[:4])
+        while iteracion < hasta and not criterio.termina():
+            movimientos = self.perturbacion(evaluador, flujo)
+            movimiento = self.funcion_vecindad(evaluador, intentos, flujo)
+            if movimiento is not None:
+                movimientos.append(movimiento)
+            evaluacion_actual = evaluador.evaluacion
+            if evaluacion_actual <= mejor_evaluacion:
+                mejor_evaluacion = evaluacion_actual
+            else:
+                evaluador.deshace(movimientos)
+                if peor < evaluacion_actual:
+                    peor = evaluacion_actual
+            suma += evaluacion_actual
+            iteracion += 1
+            criterio.registra(mejor_evaluacion)
+        progreso[:4] = iteracion, mejor_evaluacion, peor, suma
             
-    def perturbacion(self, solucion_actual):
+    def perturbacion(self, evaluador, flujo=None):
         """Función para modificar la solución actual, toma cierto
             numero de indices de la solucion y los modifica
 
         Args:
-            solucion_actual (array(int)): Representación de la solución
+            evaluador (EvaluadorIncremental): Solución actual con su evaluación
+            flujo (FlujoMovimientos, optional): Movimientos sorteados de la búsqueda. Defaults to uno nuevo.
         Returns:
-            array(int): Arreglo con la solución actual modificada
+            list(tuple): Movimientos aplicados (vertice, color anterior)
         """
-        cantidad_indices = int(len(solucion_actual)/10) + 1
-        indices = np.random.randint(len(solucion_actual), size=cantidad_indices)
-        for i in indices:
-            solucion_actual[i] = np.random.randint(1, len(solucion_actual)+1)
-        return solucion_actual
+        cantidad_indices = int(self.vertices/10) + 1
+        if flujo is None:
+            flujo = FlujoMovimientos(self.generador, self.vertices, cantidad_indices)
+        indices, colores = flujo.toma(cantidad_indices)
+        return [(i, evaluador.aplica(i, c)) for i, c in zip(indices.tolist(), colores.tolist())]
         
         
-    def genera_poblacion_inicial(self, tamanio_poblacion):
-        """Genera una población inicial con un tamaño especificado
+    def busqueda_tabu(self, iteraciones=1000):
+        """ Funcion para realizar una busqueda tabu (TabuCol). Parte de
+            grado máximo + 1 colores; cada vez que encuentra una k-coloración
+            sin conflictos elimina un color y continúa con k-1, hasta llegar a
+            dos colores o a la cota del clique si la gráfica está reducida.
+
+        Args:
+            iteraciones (int, optional): Movimientos totales de la búsqueda. Defaults to 1000.
+
+        Returns:
+            array(int): Arreglo con la mejor solucion encontrada
+        """
+        criterio = self.criterio
+        criterio.inicia()
+        tabu = BusquedaTabu(self.grafica, generador=self.generador)
+        if self.inicializacion == "aleatoria":
+            k = min(self.vertices, int(self.grafica.grados().max()) + 1)
+            colores = self.generador.integers(0, k, self.vertices)
+        else:
+            colores = self.solucion_inicial() - 1
+            k = int(colores.max()) + 1
+        mejor_solucion = colores + 1
+        mejor_evaluacion = self.funcion_evaluacion(mejor_solucion)
+        criterio.registra(mejor_evaluacion)
+        estadisticas = {"peor": mejor_evaluacion, "suma": 0}
+        minimo = 2 if self.preprocesamiento is None else max(2, self.preprocesamiento.cota)
+
+        def al_mover(conflictos, usados):
+            evaluacion = 2 * conflictos + self.grafica.lazos + usados
+            estadisticas["peor"] = max(estadisticas["peor"], evaluacion)
+            estadisticas["suma"] += evaluacion
+
+        restantes = iteraciones
+        while restantes > 0 and not criterio.termina():
+            colores, conflictos, realizadas, probados = tabu.busca(colores, k, restantes, al_mover, criterio)
+            restantes -= realizadas
+            self.instrumentacion.cuenta("movimientos_probados", probados)
+            self.instrumentacion.cuenta("movimientos_aceptados", realizadas)
+            evaluacion = self.funcion_evaluacion(colores + 1)
+            if evaluacion <= mejor_evaluacion:
+                mejor_solucion = colores + 1
+                mejor_evaluacion = evaluacion
+            if conflictos > 0 or k <= minimo:
+                break
+            k -= 1
+            eliminados = colores == k
+            colores[eliminados] = self.generador.integers(0, k, np.count_nonzero(eliminados))
+        return mejor_solucion, mejor_evaluacion, estadisticas["peor"], estadisticas["suma"]/max(iteraciones - restantes, 1)
+
+    def genera_poblacion_inicial(self, tamanio_poblacion, generador=None):
+        """Genera una población inicial con un tamaño especificado. Con una
+            inicialización constructiva cada individuo es una coloración
+            distinta por el desempate aleatorio.
 
         Args:
             tamanio_poblacion (int): Tamaño de la población a generar
+            generador (Generator, optional): Generador a usar en lugar de self.generador. Defaults to None.
 
         Returns:
             array(array(int)): Población generada
         """
-        return np.random.randint(1, self.vertices+1, size = (tamanio_poblacion, self.vertices))
+        generador = self.generador if generador is None else generador
+        if self.inicializacion == "aleatoria":
+            return generador.integers(1, self.vertices+1, size = (tamanio_poblacion, self.vertices))
+        return np.array([self.solucion_inicial(generador) for _ in range(tamanio_poblacion)])
     
-    def seleccion_padres_torneo(self, poblacion_actual):
-        """Función para seleccionar a 2 padres de la poblacion dada
+    def seleccion_padres_torneo(self, aptitudes, cantidad):
+        """Función para seleccionar de una vez a todos los padres de la
+            generación, cada uno como el mejor de un torneo de una décima
+            parte de la población
 
         Args:
-            poblacion_actual (array(array(int))): Poblacion actual
+            aptitudes (array(int)): Evaluación de cada individuo
+            cantidad (int): Número de padres a seleccionar
 
         Returns:
-            tuple: Ambos padres seleccionados
+            array(int): Índices de los padres seleccionados
         """
-        padre1, padre2 = None, None
-        for j in range(2):
-            indices_individuos = np.random.choice(len(poblacion_actual), size=int(len(poblacion_actual)/10), replace=False)
-            individuos = [poblacion_actual[i] for i in indices_individuos]
-            mejor_evaluacion = float("inf")
-            mejor_individuo_actual = None
-            for i in individuos:
-                if self.funcion_evaluacion(i) < mejor_evaluacion:
-                    mejor_evaluacion = self.funcion_evaluacion(i)
-                    mejor_individuo_actual = i
-            if j == 0:
-                padre1 = mejor_individuo_actual
-            else:
-                padre2 =mejor_individuo_actual
-        return padre1, padre2
+        tamanio_torneo = max(1, int(len(aptitudes)/10))
+        return Seleccion.torneo(aptitudes, cantidad, tamanio_torneo, self.generador)
         
-    def selecciona_mejor_individuo(self, poblacion):
+    def selecciona_mejor_individuo(self, poblacion, aptitudes):
         """Funcion para encontrar al mejor individuo de la poblacion actual
 
         Args:
             poblacion (array(array(int))): Poblacion actual
+            aptitudes (array(int)): Evaluación de cada individuo
 
         Returns:
             array(int): Mejor individuo de la poblacion actuaL
         """
-        mejor_evaluacion = float("inf")
-        mejor_individuo = None
-        for i in poblacion:
-            evaluacion = self.funcion_evaluacion(i)
-            if evaluacion < mejor_evaluacion:
-                mejor_evaluacion = evaluacion
-                mejor_individuo = i
-        return mejor_individuo
+        return poblacion[np.argmin(aptitudes)]
 
-    def encuentra_peor_evaluacion(self, poblacion, peor_evaluacion):
+    def encuentra_peor_evaluacion(self, aptitudes, peor_evaluacion):
         """Funcion para encontrar la peor evaluacion de la solucion actual
 
         Args:
-            poblacion (array(array(int))): Poblacion actual
+            aptitudes (array(int)): Evaluación de cada individuo
+            peor_evaluacion (int): Peor evaluación encontrada hasta ahora
 
         Returns:
             int: Evaluación de la peor solucion
         """
-        for i in poblacion:
-            evaluacion = self.funcion_evaluacion(i)
-            if evaluacion > peor_evaluacion:
-                peor_evaluacion = evaluacion
-        return peor_evaluacion
+        return max(peor_evaluacion, int(aptitudes.max()))
         
-    def cruza_padres(self, padre1, padre2):
-        """Cruza a los padres para generar a los hijos
+    def _buffer(self, nombre, forma, evita=None, tipo=np.int64):
+        """Regresa uno de los dos arreglos reutilizables de cierto nombre,
+            el que no comparte memoria con evita; se crean de nuevo sólo si
+            cambia la forma"""
+        buffers = self._buffers.get(nombre)
+        if buffers is None or buffers[0].shape != forma:
+            buffers = (np.empty(forma, dtype=tipo), np.empty(forma, dtype=tipo))
+            self._buffers[nombre] = buffers
+        return buffers[1] if evita is not None and np.may_share_memory(buffers[0], evita) else buffers[0]
+
+    def cruza_padres(self, padres1, padres2, hijos1, hijos2):
+        """Cruza por parejas a dos matrices de padres: con probabilidad 0.7
+            cada pareja intercambia la segunda mitad de sus colores y si no
+            los hijos son copia de los padres
 
         Args:
-            padre1 (array(int)): Primer padre
-            padre2 (array(int)): Segundo padre
-
-        Returns:
-            tuple: Hijos resultantes de la cruza 
+            padres1 (array(array(int))): Primer padre de cada pareja
+            padres2 (array(array(int))): Segundo padre de cada pareja
+            hijos1 (array(array(int))): Salida para el primer hijo de cada pareja
+            hijos2 (array(array(int))): Salida para el segundo hijo de cada pareja
         """
-        mitad = int(len(padre1)/2)
-        hijo1 = []
-        hijo2 = []
-        for i in range(len(padre1)):
-            if i < mitad:
-                hijo1.append(padre1[i])
-                hijo2.append(padre2[i])
-            else:
-                hijo1.append(padre2[i])
-                hijo2.append(padre1[i])
-        return hijo1, hijo2
+        parejas, n = padres1.shape
+        intercambia = self._buffer("cruza", (parejas, n), tipo=bool)
+        np.logical_and(np.arange(n) >= int(n/2), (self.generador.random(parejas) <= 0.7)[:, None], out=intercambia)
+        np.copyto(hijos1, padres1)
+        np.copyto(hijos1, padres2, where=intercambia)
+        np.copyto(hijos2, padres2)
+        np.copyto(hijos2, padres1, where=intercambia)
     
-    def mutacion(self, hijo):
-        """Funcion para aplicar la mutacion a un hijo
+    def mutacion(self, hijos):
+        """Funcion para aplicar la mutacion a una matriz de hijos: con
+            probabilidad 0.1 cada hijo intercambia los colores de dos vértices
 
         Args:
-            hijo (array(int)): Hijo que mutara
-        
-        Returns:
-            (array(int)): hijo con o sin mutacion
+            hijos (array(array(int))): Hijos que mutaran, se modifican en su lugar
         """
-        if np.random.random() <= 0.1:
-            indice1 = np.random.randint(0, len(hijo))
-            indice2 = np.random.randint(0, len(hijo))
-            aux = hijo[indice1]
-            hijo[indice1] = hijo[indice2]
-            hijo[indice2] = aux
-        return hijo
+        renglones = np.flatnonzero(self.generador.random(len(hijos)) <= 0.1)
+        indices1, indices2 = self.generador.integers(0, hijos.shape[1], (2, renglones.size))
+        hijos[renglones, indices1], hijos[renglones, indices2] = hijos[renglones, indices2], hijos[renglones, indices1]
     
-    def genera_siguiente_poblacion(self, poblacion):
-        """Funcion para generar la siguiente poblacion, se mantiene la mejor solucion actual
+    def genera_siguiente_poblacion(self, poblacion, aptitudes):
+        """Funcion para generar la siguiente poblacion, se mantiene la mejor solucion actual.
+            Toda la generación se produce con operaciones sobre matrices, en
+            arreglos que se reutilizan entre generaciones.
 
         Args:
             poblacion (array(array(int))): Poblacion actual
+            aptitudes (array(int)): Evaluación de cada individuo
 
         Returns:
-            array(array(int)): Nueva poblacion
+            array(array(int)): Nueva poblacion; es válida hasta dos llamadas después
         """
-        hijos = []
-        hijos.append(self.selecciona_mejor_individuo(poblacion))
-        while len(hijos) < len(poblacion):
-            padre1, padre2 = self.seleccion_padres_torneo(poblacion)
-            hijo1, hijo2 = None, None
-            if np.random.random() <= 0.7:
-                hijo1, hijo2 = self.cruza_padres(padre1, padre2)
-            else:
-                hijo1 = padre1
-                hijo2 = padre2
-            hijo1 = self.mutacion(hijo1)
-            hijo2 = self.mutacion(hijo2)
-            hijos.append(hijo1)
-            hijos.append(hijo2)
-        return hijos
+        medidor = self.instrumentacion
+        poblacion = np.asarray(poblacion)
+        tamanio, n = poblacion.shape
+        parejas = tamanio // 2
+        padres = self._buffer("padres", (2 * parejas, n))
+        siguiente = self._buffer("poblacion", (2 * parejas + 1, n), evita=poblacion)
+        with medidor.fase("seleccion"):
+            np.take(poblacion, self.seleccion_padres_torneo(aptitudes, 2 * parejas), axis=0, out=padres)
+        siguiente[0] = self.selecciona_mejor_individuo(poblacion, aptitudes)
+        hijos = siguiente[1:]
+        with medidor.fase("cruza"):
+            self.cruza_padres(padres[:parejas], padres[parejas:], hijos[:parejas], hijos[parejas:])
+        with medidor.fase("mutacion"):
+            self.mutacion(hijos)
+        return siguiente[:tamanio]
             
-    def calcula_promedio(self, poblacion):
-        promedio = 0
-        for i in poblacion:
-            promedio += self.funcion_evaluacion(i)
-        promedio = promedio/len(poblacion)
-        return promedio
+    def calcula_promedio(self, aptitudes):
+        return float(np.mean(aptitudes))
         
-    def algoritmo_genetico(self, tamanio_poblacion, iteraciones=1000):
+    def algoritmo_genetico(self, tamanio_poblacion, iteraciones=1000, bitacora=None, punto_control=None):
         """Funcion que ejecuta el algoritmo genetico para coloracion
 
         Args:
             tamanio_poblacion (int): Tamaño de la poblacion
             iteraciones (int, optional): Número de iteraciones a realizar en el algoritmo. Defaults to 1000.
+            bitacora (BitacoraConvergencia, optional): Registro de convergencia por generación. Defaults to None.
+            punto_control (PuntoControl, optional): Guarda el estado periódicamente y permite reanudar. Defaults to None.
 
         Returns:
             array(int): La mejor solución encontrada
         """
-        file = open('Ejecucion.txt', 'w')
-        poblacion = self.genera_poblacion_inicial(tamanio_poblacion)
-        mejor_solucion = None
-        peor_evaluacion = 0
-        promedio_evaluacion = 0
-        for i in range(iteraciones):
-            mejor_solucion = self.selecciona_mejor_individuo(poblacion)
-            peor_evaluacion = self.encuentra_peor_evaluacion(poblacion, peor_evaluacion)
-            promedio_evaluacion = (self.calcula_promedio(poblacion) + promedio_evaluacion)/2
-            mejor_evaluacion = self.funcion_evaluacion(mejor_solucion)
-            file.write(str(i) + " " + str(mejor_evaluacion) + "\n")
-            poblacion = self.genera_siguiente_poblacion(poblacion)
-        file.close()
+        estado = None if punto_control is None else punto_control.reanuda("genetica", self.generador)
+        criterio = self.criterio
+        criterio.inicia()
+        if estado is None:
+            poblacion = self.genera_poblacion_inicial(tamanio_poblacion)
+            mejor_solucion = None
+            mejor_evaluacion = None
+            peor_evaluacion = 0
+            promedio_evaluacion = 0
+            inicio = 0
+        else:
+            poblacion, mejor_solucion = estado["poblacion"], estado["mejor_solucion"]
+            mejor_evaluacion, peor_evaluacion = estado["mejor_evaluacion"], estado["peor"]
+            promedio_evaluacion, inicio = estado["promedio"], estado["iteracion"]
+            criterio.restaura(estado["criterio"])
+            if bitacora is not None:
+                bitacora.recorta(estado["renglones_bitacora"])
+        def datos():
+            if bitacora is not None:
+                bitacora.escribe()
+            return {"poblacion": poblacion, "mejor_solucion": mejor_solucion, "mejor_evaluacion": mejor_evaluacion,
+                    "peor": peor_evaluacion, "promedio": promedio_evaluacion, "iteracion": hechas,
+                    "renglones_bitacora": None if bitacora is None else bitacora.escritos,
+                    "criterio": criterio.estado()}
+        medidor = self.instrumentacion
+        hechas = inicio
+        for i in range(inicio, iteraciones):
+            # la primera generación siempre se evalúa para tener una mejor solución
+            if mejor_solucion is not None and criterio.termina():
+                break
+            with medidor.fase("evaluacion"):
+                aptitudes = self.evaluar_poblacion(poblacion)
+            mejor_solucion = self.selecciona_mejor_individuo(poblacion, aptitudes).copy()
+            peor_evaluacion = self.encuentra_peor_evaluacion(aptitudes, peor_evaluacion)
+            promedio_evaluacion = (self.calcula_promedio(aptitudes) + promedio_evaluacion)/2
+            mejor_evaluacion = int(aptitudes.min())
+            if bitacora is not None:
+                bitacora.registra(i, mejor_evaluacion, peor_evaluacion, promedio_evaluacion)
+            medidor.generacion(i, mejor_evaluacion, peor_evaluacion, promedio_evaluacion)
+            criterio.registra(mejor_evaluacion)
+            poblacion = self.genera_siguiente_poblacion(poblacion, aptitudes)
+            hechas = i + 1
+            if punto_control is not None:
+                punto_control.revisa("genetica", datos, self.generador)
+        if punto_control is not None:
+            punto_control.guarda("genetica", datos(), self.generador)
         return mejor_solucion, mejor_evaluacion, peor_evaluacion, promedio_evaluacion
+
+    def evoluciona(self, poblacion, generaciones):
+        """Evoluciona una población dada durante cierto número de generaciones,
+            sin bitácora. Se usa para las islas del modelo paralelo.
+
+        Args:
+            poblacion (array(array(int))): Población inicial
+            generaciones (int): Generaciones a realizar
+
+        Returns:
+            tuple: Población final, sus evaluaciones, peor evaluación vista
+            y el promedio de la población en cada generación
+        """
+        peor_evaluacion = 0
+        promedios = []
+        for _ in range(generaciones):
+            aptitudes = self.evaluar_poblacion(poblacion)
+            peor_evaluacion = self.encuentra_peor_evaluacion(aptitudes, peor_evaluacion)
+            promedios.append(self.calcula_promedio(aptitudes))
+            poblacion = self.genera_siguiente_poblacion(poblacion, aptitudes)
+        aptitudes = self.evaluar_poblacion(poblacion)
+        peor_evaluacion = self.encuentra_peor_evaluacion(aptitudes, peor_evaluacion)
+        return poblacion, aptitudes, peor_evaluacion, promedios
                 
     
-    def realiza_busqueda(self, busqueda, iteraciones, tamanio_poblacion = 50):
+    def realiza_busqueda(self, busqueda, iteraciones, tamanio_poblacion = 50, islas = 4,
+                         intervalo_migracion = 10, migrantes = 2, procesos = None, bitacora = None, punto_control = None):
         """ Función para realizar la búsqueda especificada
 
         Args:
             busqueda (str): Búsqueda a realizar
             iteraciones (int): Iteraciones a realizar en la búsqueda
+            tamanio_poblacion (int, optional): Tamaño de la población (de cada isla). Defaults to 50.
+            islas (int, optional): Número de islas del genético paralelo. Defaults to 4.
+            intervalo_migracion (int, optional): Generaciones entre migraciones. Defaults to 10.
+            migrantes (int, optional): Individuos que migran de cada isla. Defaults to 2.
+            procesos (int, optional): Procesos a usar, None para usar todos los núcleos. Defaults to None.
+            bitacora (str, optional): Archivo (.txt o .npy) para la convergencia del genético, None para no registrarla. Defaults to None.
+            punto_control (PuntoControl, optional): Puntos de control de escalada, iterada y genetica. Defaults to None.
+
+        Sobre una gráfica reducida (ver reduce) la mejor solución se expande y
+        se evalúa en la gráfica original; peor y promedio son de la reducida.
         """
         if busqueda == "aleatoria":
             solucion_aleatoria, evaluacion, peor, promedio = self.soluciones_aleatorias(iteraciones=iteraciones)
+            solucion_aleatoria, evaluacion = self.solucion_original(solucion_aleatoria, evaluacion)
             print(f"Resultado de la busqueda aleatoria, iteraciones: {iteraciones}. Mejor solucion: {solucion_aleatoria} con evaluacion de {evaluacion}. Peor: {peor} Promedio: {promedio}")
         elif busqueda == "escalada":
-            solucion_escalada, evaluacion, peor, promedio = self.busqueda_escalada(iteraciones=iteraciones)
+            solucion_escalada, evaluacion, peor, promedio = self.busqueda_escalada(iteraciones, punto_control)
+            solucion_escalada, evaluacion = self.solucion_original(solucion_escalada, evaluacion)
             print(f"Resultado de la busqueda por escalada, iteraciones: {iteraciones}. Mejor solucion: {solucion_escalada} con evaluacion de {evaluacion}. Peor: {peor} Promedio: {promedio}")
         elif busqueda == "iterada":
-            solucion_iterada, evaluacion, peor, promedio = self.busqueda_local_iterada(iteraciones=iteraciones)
+            solucion_iterada, evaluacion, peor, promedio = self.busqueda_local_iterada(iteraciones, punto_control)
+            solucion_iterada, evaluacion = self.solucion_original(solucion_iterada, evaluacion)
             print(f"Resultado de la busqueda local iterada, iteraciones: {iteraciones}. Mejor solucion: {solucion_iterada} con evaluacion de {evaluacion}. Peor: {peor} Promedio: {promedio}")
+        elif busqueda == "tabu":
+            solucion_tabu, evaluacion, peor, promedio = self.busqueda_tabu(iteraciones=iteraciones)
+            solucion_tabu, evaluacion = self.solucion_original(solucion_tabu, evaluacion)
+            print(f"Resultado de la busqueda tabu, iteraciones: {iteraciones}. Mejor solucion: {solucion_tabu} con evaluacion de {evaluacion}. Peor: {peor} Promedio: {promedio}")
         elif busqueda == "genetica":
-            solucion_genetica, evaluacion, peor, promedio = self.algoritmo_genetico(tamanio_poblacion, iteraciones)
+            if bitacora is None:
+                solucion_genetica, evaluacion, peor, promedio = self.algoritmo_genetico(tamanio_poblacion, iteraciones,
+                                                                                        punto_control=punto_control)
+            else:
+                continuar = punto_control is not None and punto_control.estado is not None
+                with BitacoraConvergencia(bitacora, continuar=continuar) as registro:
+                    solucion_genetica, evaluacion, peor, promedio = self.algoritmo_genetico(tamanio_poblacion, iteraciones,
+                                                                                            registro, punto_control)
+            solucion_genetica, evaluacion = self.solucion_original(solucion_genetica, evaluacion)
             print(f"Resultado del algoritmo genetico con tamaño de poblacion: {tamanio_poblacion}, iteraciones: {iteraciones} \n Mejor individuo encontrado {solucion_genetica} con una evaluación de: {evaluacion}. Peor: {peor} Promedio: {promedio}")
-            Graficacion.grafica_txt("Ejecucion.txt", "Coloracion", iteraciones)
+            if bitacora is not None:
+                print(f"Gráfica de convergencia en {Graficacion.grafica_txt(bitacora, 'Coloracion', iteraciones)}")
+        elif busqueda == "islas":
+            from Islas import ModeloIslas
+            modelo = ModeloIslas(self, islas, intervalo_migracion, migrantes, procesos)
+            solucion_islas, evaluacion, peor, promedio = modelo.ejecuta(tamanio_poblacion, iteraciones)
+            solucion_islas, evaluacion = self.solucion_original(solucion_islas, evaluacion)
+            print(f"Resultado del algoritmo genetico por islas con {islas} islas de tamaño {tamanio_poblacion}, iteraciones: {iteraciones} \n Mejor individuo encontrado {solucion_islas} con una evaluación de: {evaluacion}. Peor: {peor} Promedio: {promedio}")
         else:
-            print("Para seleccionar una busqueda debe escribir aleatoria o escalada")
+            print("Para seleccionar una busqueda debe escribir aleatoria, escalada, iterada, tabu, genetica o islas")
+        if self.criterio.motivo is not None:
+            print(f"La búsqueda terminó antes de tiempo por: {self.criterio.motivo}")
 
 if __name__ == "__main__":
     """Main donde se procesará el archivo ingresado y realizará la búsqueda especificada
     """
-    if len(sys.argv) < 4 or len(sys.argv) > 5:
-        print("Uso: python Coloracion.py <nombre_archivo> <busqueda> <iteraciones>")
+    parser = argparse.ArgumentParser(description="Búsquedas para el problema de coloración")
+    parser.add_argument("nombre_archivo", help="Archivo con la gráfica en formato DIMACS")
+    parser.add_argument("busqueda", help="aleatoria, escalada, iterada, tabu, genetica o islas")
+    parser.add_argument("iteraciones", type=int, nargs="?", default=1000)
+    parser.add_argument("poblacion", type=int, nargs="?", default=50, help="Tamaño de población (solo genético)")
+    parser.add_argument("--islas", type=int, default=4, help="Número de islas (solo islas)")
+    parser.add_argument("--intervalo-migracion", type=int, default=10, help="Generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2, help="Individuos que migran de cada isla")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos a usar (por defecto todos los núcleos)")
+    parser.add_argument("--sin-cache-grafica", action="store_true", help="No leer ni escribir la cache .npz de la gráfica")
+    parser.add_argument("--cache", type=int, default=0, help="Máximo de evaluaciones memorizadas (0 la desactiva)")
+    parser.add_argument("--instrumentar", action="store_true", help="Mostrar el tiempo por fase y los contadores de la búsqueda")
+    parser.add_argument("--profile", default=None, help="Guardar un perfil de cProfile (pstats) en este archivo")
+    parser.add_argument("--inicializacion", choices=["aleatoria", "grado", "dsatur", "rlf", "mixta"], default="aleatoria",
+                        help="Solución inicial de escalada, iterada y tabu, y población inicial del genético y las islas")
+    parser.add_argument("--backend", choices=list(Nucleos.BACKENDS), default="numpy",
+                        help="numba compila la evaluación y los ciclos de escalada e iterada (si está instalado)")
+    parser.add_argument("--objetivo", type=int, default=None,
+                        help="Terminar al llegar a esta evaluación (una k-coloración sin conflictos evalúa lazos + k)")
+    parser.add_argument("--sin-mejora", type=int, default=None, help="Terminar tras estas iteraciones o generaciones sin mejora")
+    parser.add_argument("--max-evaluaciones", type=int, default=None,
+                        help="Terminar tras estas evaluaciones (cada vecino probado cuenta como una)")
+    parser.add_argument("--tiempo", type=float, default=None, help="Terminar tras estos segundos")
+    parser.add_argument("--vecinos", type=int, default=None, help="Vecinos a probar por paso de escalada e iterada (por defecto 10 por vértice)")
+    parser.add_argument("--reducir", action="store_true",
+                        help="Buscar sobre la gráfica reducida y terminar al alcanzar la cota del clique")
+    parser.add_argument("--colores", type=int, default=None,
+                        help="Colores objetivo de la reducción por grado (por defecto la cota del clique)")
+    parser.add_argument("--sin-dominados", action="store_true", help="No eliminar vértices dominados al reducir")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla del generador de números aleatorios")
+    parser.add_argument("--checkpoint", default=None, help="Archivo de punto de control (escalada, iterada y genetica)")
+    parser.add_argument("--checkpoint-segundos", type=float, default=5.0, help="Segundos entre puntos de control")
+    parser.add_argument("--resume", action="store_true", help="Reanudar desde el archivo de --checkpoint si existe")
+    parser.add_argument("--bitacora", default="Ejecucion.txt", help="Archivo de convergencia del genético, .txt o .npy (vacío para desactivarla)")
+    argumentos = parser.parse_args()
+    coloracion = Coloracion.leer_archivo(argumentos.nombre_archivo, not argumentos.sin_cache_grafica)
+    coloracion.activa_cache(argumentos.cache)
+    coloracion.asigna_generador(argumentos.semilla)
+    coloracion.inicializacion = argumentos.inicializacion
+    coloracion.asigna_backend(argumentos.backend)
+    coloracion.criterio = CriterioParo(argumentos.objetivo, argumentos.sin_mejora, argumentos.max_evaluaciones,
+                                       argumentos.tiempo, argumentos.vecinos)
+    if argumentos.instrumentar:
+        coloracion.instrumentacion = Instrumentacion()
+    if argumentos.resume and argumentos.checkpoint is None:
+        parser.error("--resume necesita --checkpoint")
+    if argumentos.checkpoint is not None and argumentos.busqueda not in Coloracion.BUSQUEDAS_CON_PUNTO_CONTROL:
+        parser.error(f"--checkpoint y --resume sólo aplican a {', '.join(Coloracion.BUSQUEDAS_CON_PUNTO_CONTROL)}")
+    punto_control = None
+    if argumentos.checkpoint is not None:
+        punto_control = PuntoControl(argumentos.checkpoint, argumentos.checkpoint_segundos, argumentos.resume)
+    if argumentos.reducir:
+        coloracion = coloracion.reduce(argumentos.colores, not argumentos.sin_dominados)
+        preprocesamiento = coloracion.preprocesamiento
+        print(f"Gráfica reducida: {coloracion.vertices} de {preprocesamiento.grafica.vertices} vértices, "
+              f"{coloracion.grafica.numero_aristas()} de {preprocesamiento.grafica.numero_aristas()} aristas. "
+              f"Cota inferior (clique): {preprocesamiento.cota} colores")
+    parametros = (argumentos.busqueda, argumentos.iteraciones, argumentos.poblacion,
+                  argumentos.islas, argumentos.intervalo_migracion,
+                  argumentos.migrantes, argumentos.procesos, argumentos.bitacora or None, punto_control)
+    if argumentos.profile is not None:
+        perfila(argumentos.profile, coloracion.realiza_busqueda, *parametros)
     else:
-        nombre_archivo = sys.argv[1]
-        busqueda = sys.argv[2]
-        coloracion = Coloracion.leer_archivo(nombre_archivo)
-        #print(f"Representacion de la gráfica: \n {coloracion.grafica}")
-        if len(sys.argv) == 4:
-            coloracion.realiza_busqueda(busqueda, int(sys.argv[3]))
-        elif len(sys.argv) == 5:
-            coloracion.realiza_busqueda(busqueda, int(sys.argv[3]), int(sys.argv[4]))
-        else:
-            coloracion.realiza_busqueda(busqueda, 1000)
-        
\ No newline at end of file
+        coloracion.realiza_busqueda(*parametros)
+    if coloracion.cache is not None:
+        print(f"Cache de evaluaciones: {coloracion.cache.aciertos} aciertos, {coloracion.cache.fallos} fallos")
+        coloracion.instrumentacion.cuenta("cache_aciertos", coloracion.cache.aciertos)
+        coloracion.instrumentacion.cuenta("cache_fallos", coloracion.cache.fallos)
+    if argumentos.instrumentar:
+        print(coloracion.instrumentacion.resumen())
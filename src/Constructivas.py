@@ -0,0 +1,167 @@
+import heapq
+import numpy as np
+
+class Constructivas:
+    """Heurísticas constructivas de coloración: voraz por grado, DSATUR y
+    RLF. Todas producen coloraciones sin conflictos con colores desde 1.
+
+    Los empates se rompen con un número aleatorio por vértice, así que con
+    distintos generadores se obtienen coloraciones distintas que sirven para
+    sembrar poblaciones. DSATUR y RLF usan un montículo con borrado perezoso:
+    cuando cambia la prioridad de un vértice se agrega una entrada nueva y
+    las entradas viejas se descartan al salir.
+    """
+
+    METODOS = ("grado", "dsatur", "rlf")
+
+    @staticmethod
+    def voraz(grafica, orden):
+        """Asigna a cada vértice, en el orden dado, el menor color que no
+            usa ninguno de sus vecinos ya coloreados
+
+        Args:
+            grafica (Grafica): Gráfica a colorear
+            orden (array(int)): Orden en que se colorean los vértices
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        indptr = grafica.indptr.tolist()
+        indices = grafica.indices.tolist()
+        colores = [0] * grafica.vertices
+        for v in orden.tolist():
+            usados = {colores[w] for w in indices[indptr[v]:indptr[v + 1]]}
+            color = 1
+            while color in usados:
+                color += 1
+            colores[v] = color
+        return np.array(colores, dtype=np.int64)
+
+    @staticmethod
+    def por_grado(grafica, generador=None):
+        """Coloración voraz en orden de grado decreciente (Welsh-Powell)
+
+        Args:
+            grafica (Grafica): Gráfica a colorear
+            generador (Generator, optional): Generador para romper empates. Defaults to None.
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        ruido = np.random.default_rng(generador).random(grafica.vertices)
+        return Constructivas.voraz(grafica, np.lexsort((ruido, -grafica.grados())))
+
+    @staticmethod
+    def dsatur(grafica, generador=None):
+        """DSATUR: colorea primero el vértice con más colores distintos entre
+            sus vecinos (saturación) y, en empate, el de mayor grado entre
+            los vértices sin color
+
+        Args:
+            grafica (Grafica): Gráfica a colorear
+            generador (Generator, optional): Generador para romper empates. Defaults to None.
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        n = grafica.vertices
+        indptr = grafica.indptr.tolist()
+        indices = grafica.indices.tolist()
+        ruido = np.random.default_rng(generador).random(n).tolist()
+        grado = grafica.grados().tolist()
+        saturacion = [set() for _ in range(n)]
+        colores = [0] * n
+        monticulo = [(0, -grado[v], ruido[v], v) for v in range(n)]
+        heapq.heapify(monticulo)
+        while monticulo:
+            menos_saturacion, menos_grado, _, v = heapq.heappop(monticulo)
+            if colores[v] or -menos_saturacion != len(saturacion[v]) or -menos_grado != grado[v]:
+                continue
+            color = 1
+            while color in saturacion[v]:
+                color += 1
+            colores[v] = color
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if not colores[w]:
+                    grado[w] -= 1
+                    saturacion[w].add(color)
+                    heapq.heappush(monticulo, (-len(saturacion[w]), -grado[w], ruido[w], w))
+        return np.array(colores, dtype=np.int64)
+
+    @staticmethod
+    def rlf(grafica, generador=None):
+        """RLF (Recursive Largest First): construye una clase de color a la
+            vez. Empieza con el vértice sin color de mayor grado y agrega
+            repetidamente al candidato con más vecinos entre los vértices ya
+            descartados para la clase y, en empate, con menos vecinos entre
+            los candidatos.
+
+        Args:
+            grafica (Grafica): Gráfica a colorear
+            generador (Generator, optional): Generador para romper empates. Defaults to None.
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        n = grafica.vertices
+        indptr = grafica.indptr.tolist()
+        indices = grafica.indices.tolist()
+        ruido = np.random.default_rng(generador).random(n).tolist()
+        grado_sin_color = grafica.grados().tolist()
+        colores = [0] * n
+        sin_color = set(range(n))
+        color = 0
+        while sin_color:
+            color += 1
+            candidatos = set(sin_color)
+            en_descartados = dict.fromkeys(sin_color, 0)
+            en_candidatos = {v: grado_sin_color[v] for v in sin_color}
+            v = max(sin_color, key=lambda u: (grado_sin_color[u], -ruido[u]))
+            monticulo = None
+            while v is not None:
+                colores[v] = color
+                candidatos.discard(v)
+                sin_color.discard(v)
+                for w in indices[indptr[v]:indptr[v + 1]]:
+                    if colores[w]:
+                        continue
+                    grado_sin_color[w] -= 1
+                    if w not in candidatos:
+                        continue
+                    candidatos.discard(w)
+                    for x in indices[indptr[w]:indptr[w + 1]]:
+                        if x in candidatos:
+                            en_descartados[x] += 1
+                            en_candidatos[x] -= 1
+                            if monticulo is not None:
+                                heapq.heappush(monticulo, (-en_descartados[x], en_candidatos[x], ruido[x], x))
+                if monticulo is None:
+                    monticulo = [(-en_descartados[w], en_candidatos[w], ruido[w], w) for w in candidatos]
+                    heapq.heapify(monticulo)
+                v = None
+                while monticulo:
+                    menos_descartados, vecinos_candidatos, _, w = heapq.heappop(monticulo)
+                    if w in candidatos and -menos_descartados == en_descartados[w] and vecinos_candidatos == en_candidatos[w]:
+                        v = w
+                        break
+        return np.array(colores, dtype=np.int64)
+
+    @staticmethod
+    def colorea(metodo, grafica, generador=None):
+        """Colorea la gráfica con la heurística indicada
+
+        Args:
+            metodo (str): grado, dsatur o rlf
+            grafica (Grafica): Gráfica a colorear
+            generador (Generator, optional): Generador para romper empates. Defaults to None.
+
+        Returns:
+            array(int): Color de cada vértice, desde 1
+        """
+        if metodo == "grado":
+            return Constructivas.por_grado(grafica, generador)
+        elif metodo == "dsatur":
+            return Constructivas.dsatur(grafica, generador)
+        elif metodo == "rlf":
+            return Constructivas.rlf(grafica, generador)
+        raise ValueError(f"Heurística constructiva desconocida: {metodo}")
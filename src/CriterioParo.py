@@ -0,0 +1,141 @@
+import time
+
+class CriterioParo:
+    """Condiciones para terminar una búsqueda antes de agotar sus
+    iteraciones o generaciones:
+
+    - objetivo: la mejor evaluación llega a este valor o menos (por ejemplo
+      una k-coloración sin conflictos, que evalúa lazos + k);
+    - sin_mejora: pasan tantas iteraciones o generaciones seguidas sin que
+      baje la mejor evaluación;
+    - evaluaciones: se hacen tantas evaluaciones de la función objetivo,
+      contando como una cada vecino probado de las búsquedas locales;
+    - segundos: se acaba el tiempo, contado desde inicia.
+
+    Cada condición en None se ignora; sin ninguna la búsqueda corre todas
+    sus iteraciones. Las búsquedas llaman a inicia al empezar, a cuenta y
+    registra en cada paso y revisan termina antes del siguiente, así que el
+    presupuesto de evaluaciones se puede rebasar a lo más en un paso (en la
+    búsqueda tabú, en un bloque de movimientos).
+    vecinos acota los vecinos que se prueban en cada paso de una búsqueda
+    local (por defecto 10 por vértice).
+    """
+
+    def __init__(self, objetivo=None, sin_mejora=None, evaluaciones=None, segundos=None, vecinos=None):
+        self.objetivo = objetivo
+        self.sin_mejora = sin_mejora
+        self.evaluaciones = evaluaciones
+        self.segundos = segundos
+        self.vecinos = vecinos
+        self.inicia()
+
+    def inicia(self):
+        """Reinicia los contadores y el reloj para una búsqueda nueva"""
+        self.realizadas = 0
+        self.mejor = None
+        self.pasos_sin_mejora = 0
+        self.motivo = None
+        self.inicio = time.perf_counter()
+
+    def con_objetivo(self, objetivo):
+        """Regresa una copia sin contadores con otro objetivo; si ya había
+            uno se conserva el que se alcanza primero (el mayor)
+
+        Args:
+            objetivo (float): Evaluación con la que se termina
+
+        Returns:
+            CriterioParo: Criterio con el objetivo combinado
+        """
+        if self.objetivo is not None:
+            objetivo = max(objetivo, self.objetivo)
+        return CriterioParo(objetivo, self.sin_mejora, self.evaluaciones, self.segundos, self.vecinos)
+
+    def intentos(self, vertices):
+        """Vecinos a probar en cada paso de una búsqueda local
+
+        Args:
+            vertices (int): Vértices de la gráfica
+
+        Returns:
+            int: Máximo de vecinos por paso
+        """
+        return 10 * vertices if self.vecinos is None else self.vecinos
+
+    def restantes(self):
+        """Evaluaciones que quedan del presupuesto
+
+        Returns:
+            int: Evaluaciones restantes, None si no hay presupuesto
+        """
+        return None if self.evaluaciones is None else max(self.evaluaciones - self.realizadas, 0)
+
+    def cuenta(self, cantidad=1):
+        """Suma evaluaciones de la función objetivo
+
+        Args:
+            cantidad (int, optional): Evaluaciones hechas. Defaults to 1.
+        """
+        self.realizadas += cantidad
+
+    def registra(self, evaluacion, pasos=1):
+        """Registra la mejor evaluación después de uno o varios pasos
+
+        Args:
+            evaluacion (float): Mejor evaluación del paso
+            pasos (int, optional): Iteraciones o generaciones que representa. Defaults to 1.
+        """
+        if self.mejor is None or evaluacion < self.mejor:
+            self.mejor = evaluacion
+            self.pasos_sin_mejora = 0
+        else:
+            self.pasos_sin_mejora += pasos
+
+    def alcanzado(self, evaluacion):
+        """Indica si una evaluación alcanza el objetivo
+
+        Args:
+            evaluacion (float): Evaluación a revisar
+
+        Returns:
+            bool: True si hay objetivo y la evaluación no lo supera
+        """
+        return self.objetivo is not None and evaluacion <= self.objetivo
+
+    def termina(self):
+        """Revisa las condiciones de paro y guarda en motivo la que se cumplió
+
+        Returns:
+            bool: True si la búsqueda debe terminar
+        """
+        if self.mejor is not None and self.alcanzado(self.mejor):
+            self.motivo = "objetivo"
+        elif self.sin_mejora is not None and self.pasos_sin_mejora >= self.sin_mejora:
+            self.motivo = "sin_mejora"
+        elif self.evaluaciones is not None and self.realizadas >= self.evaluaciones:
+            self.motivo = "evaluaciones"
+        elif self.segundos is not None and time.perf_counter() - self.inicio >= self.segundos:
+            self.motivo = "tiempo"
+        return self.motivo is not None
+
+    def estado(self):
+        """Regresa los contadores para guardarlos en un punto de control
+
+        Returns:
+            dict: Evaluaciones, mejor, pasos sin mejora y segundos transcurridos
+        """
+        return {"realizadas": self.realizadas, "mejor": self.mejor, "pasos_sin_mejora": self.pasos_sin_mejora,
+                "transcurrido": time.perf_counter() - self.inicio}
+
+    def restaura(self, estado):
+        """Restaura los contadores guardados con estado; el tiempo ya
+            transcurrido cuenta para el límite de segundos
+
+        Args:
+            estado (dict): Contadores guardados
+        """
+        self.realizadas = estado["realizadas"]
+        self.mejor = estado["mejor"]
+        self.pasos_sin_mejora = estado["pasos_sin_mejora"]
+        self.motivo = None
+        self.inicio = time.perf_counter() - estado["transcurrido"]
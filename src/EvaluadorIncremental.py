@@ -0,0 +1,93 @@
+import numpy as np
+
+class EvaluadorIncremental:
+    """Mantiene una solución de coloración junto con el número de
+    conflictos de cada vértice y el histograma de colores usados, de modo
+    que recolorear un vértice se evalúa y se aplica en O(grado(v)).
+
+    La evaluación coincide con Coloracion.funcion_evaluacion.
+    """
+
+    def __init__(self, grafica, colores):
+        self.grafica = grafica
+        self.colores = np.array(colores, dtype=np.int64)
+        n = grafica.vertices
+        iguales = self.colores[grafica.u] == self.colores[grafica.v]
+        self.conflictos = (np.bincount(grafica.u[iguales], minlength=n)
+                           + np.bincount(grafica.v[iguales], minlength=n))
+        self.histograma = np.bincount(self.colores, minlength=n + 1)
+        self.aristas_conflicto = int(np.count_nonzero(iguales))
+        self.colores_usados = int(np.count_nonzero(self.histograma[1:n + 1]))
+
+    @property
+    def evaluacion(self):
+        """Evaluación de la solución actual
+
+        Returns:
+            int: Dos veces las aristas en conflicto, más los lazos,
+            más el número de colores usados
+        """
+        return 2 * self.aristas_conflicto + self.grafica.lazos + self.colores_usados
+
+    def _cambio_colores(self, anterior, color):
+        usados = 0
+        if self.histograma[anterior] == 1:
+            usados -= 1
+        if self.histograma[color] == 0:
+            usados += 1
+        return usados
+
+    def delta(self, vertice, color):
+        """Calcula el cambio en la evaluación al recolorear un vértice,
+            sin modificar la solución
+
+        Args:
+            vertice (int): Vértice a recolorear
+            color (int): Nuevo color
+
+        Returns:
+            int: Evaluación nueva menos evaluación actual
+        """
+        anterior = self.colores[vertice]
+        if color == anterior:
+            return 0
+        colores_vecinos = self.colores[self.grafica.vecinos(vertice)]
+        conflictos = np.count_nonzero(colores_vecinos == color) - np.count_nonzero(colores_vecinos == anterior)
+        return 2 * int(conflictos) + self._cambio_colores(anterior, color)
+
+    def aplica(self, vertice, color):
+        """Recolorea un vértice actualizando los conflictos y el histograma
+
+        Args:
+            vertice (int): Vértice a recolorear
+            color (int): Nuevo color
+
+        Returns:
+            int: Color que tenía el vértice antes del movimiento
+        """
+        anterior = int(self.colores[vertice])
+        if color == anterior:
+            return anterior
+        vecinos = self.grafica.vecinos(vertice)
+        colores_vecinos = self.colores[vecinos]
+        salen = vecinos[colores_vecinos == anterior]
+        entran = vecinos[colores_vecinos == color]
+        self.conflictos[salen] -= 1
+        self.conflictos[entran] += 1
+        self.conflictos[vertice] = entran.size
+        self.aristas_conflicto += entran.size - salen.size
+        self.colores_usados += self._cambio_colores(anterior, color)
+        self.histograma[anterior] -= 1
+        self.histograma[color] += 1
+        self.colores[vertice] = color
+        return anterior
+
+    def deshace(self, movimientos):
+        """Revierte una lista de movimientos en orden inverso
+
+        Args:
+            movimientos (list(tuple)): Pares (vertice, color anterior)
+            en el orden en que se aplicaron
+        """
+        for vertice, anterior in reversed(movimientos):
+            self.aplica(vertice, anterior)
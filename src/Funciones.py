@@ -17,11 +17,16 @@ class Funciones:
         """Método que implementa la función Rosenbrock
 
         Args:
-            valores (list(float)): lista de valores con los que se evaluará la función
+            valores (list(float)): lista de valores con los que se evaluará la función,
+            o una matriz (tamaño, dimension) con un individuo por renglón
 
         Returns:
-            float: resultado de evaluar la función
+            float: resultado de evaluar la función, o un arreglo con el
+            resultado de cada renglón
         """
+        if np.ndim(valores) == 2:
+            x = np.asarray(valores, dtype=np.float64)
+            return np.sum(100 * (x[:, 1:] - x[:, :-1] ** 2) ** 2 + (x[:, :-1] - 1) ** 2, axis=1)
         suma = 0
         for i in range(len(valores) - 1):
             term1 = 100 * (valores[i + 1] - valores[i] ** 2) ** 2
@@ -34,10 +39,15 @@ class Funciones:
         """Método que implementa la función Sphere
 
         Args:
-            valores (list(float)): lista de valores con los que se evaluará la función
+            valores (list(float)): lista de valores con los que se evaluará la función,
+            o una matriz (tamaño, dimension) con un individuo por renglón
         Returns:
-            float: resultado de evaluar la función
+            float: resultado de evaluar la función, o un arreglo con el
+            resultado de cada renglón
         """
+        if np.ndim(valores) == 2:
+            x = np.asarray(valores, dtype=np.float64)
+            return np.sum(x ** 2, axis=1)
         suma = 0
         for i in range(len(valores)):
             suma += valores[i] ** 2
@@ -48,10 +58,15 @@ class Funciones:
         """Método que implementa la función Rastrigin
 
         Args:
-            valores (list(float)): lista de valores con los que se evaluará la función
+            valores (list(float)): lista de valores con los que se evaluará la función,
+            o una matriz (tamaño, dimension) con un individuo por renglón
         Returns:
-            float: resultado de evaluar la función
+            float: resultado de evaluar la función, o un arreglo con el
+            resultado de cada renglón
         """
+        if np.ndim(valores) == 2:
+            x = np.asarray(valores, dtype=np.float64)
+            return 10 * x.shape[1] + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x), axis=1)
         suma = 10 * len(valores)
         for i in range(len(valores)):
             suma += valores[i] ** 2
@@ -63,17 +78,25 @@ class Funciones:
         """Método que implementa la función Ackley
 
         Args:
-            valores (list(float)): lista de valores con los que se evaluará la función
+            valores (list(float)): lista de valores con los que se evaluará la función,
+            o una matriz (tamaño, dimension) con un individuo por renglón
         Returns:
-            float: resultado de evaluar la función
+            float: resultado de evaluar la función, o un arreglo con el
+            resultado de cada renglón
         """
+        if np.ndim(valores) == 2:
+            x = np.asarray(valores, dtype=np.float64)
+            n = x.shape[1]
+            suma1 = np.sum(x ** 2, axis=1)
+            suma2 = np.sum(np.cos(2 * np.pi * x), axis=1)
+            return 20 + np.e - 20 * np.exp(-0.2 * np.sqrt(suma1 / n)) - np.exp(suma2 / n)
         suma1 = 0
         suma2 = 0 
         for i in range(len(valores)):
             suma1 += valores[i]**2
         for i in range(len(valores)):
             suma2 += math.cos(2 * math.pi * valores[i])
-        resultado = 20 + math.e - 20*np.exp(-0.2*(math.sqrt(suma1/len(valores)))) - np.exp(suma2/len(valores))
+        resultado = 20 + math.e - 20*math.exp(-0.2*(math.sqrt(suma1/len(valores)))) - math.exp(suma2/len(valores))
         return resultado
     
     @staticmethod
@@ -81,10 +104,16 @@ class Funciones:
         """Método que implementa la función Griewank
 
         Args:
-            valores (list(float)): lista de valores con los que se evaluará la función
+            valores (list(float)): lista de valores con los que se evaluará la función,
+            o una matriz (tamaño, dimension) con un individuo por renglón
         Returns:
-            float: resultado de evaluar la función
+            float: resultado de evaluar la función, o un arreglo con el
+            resultado de cada renglón
         """
+        if np.ndim(valores) == 2:
+            x = np.asarray(valores, dtype=np.float64)
+            multi = np.prod(np.cos(x[:, 1:] / np.sqrt(np.arange(1, x.shape[1]))), axis=1)
+            return 1 + np.sum(x ** 2 / 4000, axis=1) - multi
         suma = 0
         for i in range(len(valores)):
             suma += (valores[i]**2)/4000
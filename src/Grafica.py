@@ -0,0 +1,75 @@
+import numpy as np
+
+class Grafica:
+    """Representación dispersa de una gráfica no dirigida.
+
+    Guarda la adyacencia en formato CSR (indptr/indices) y, además,
+    un arreglo plano con cada arista (u, v), u < v, una sola vez.
+    La memoria usada es proporcional al número de aristas.
+    """
+
+    def __init__(self, vertices, indptr, indices, u, v, lazos):
+        self.vertices = vertices
+        self.indptr = indptr
+        self.indices = indices
+        self.u = u
+        self.v = v
+        self.lazos = lazos
+
+    @staticmethod
+    def desde_aristas(vertices, origen, destino):
+        """Construye la gráfica a partir de dos arreglos con los extremos
+            de cada arista (índices desde 0). Las aristas repetidas o listadas
+            en ambos sentidos se guardan una sola vez.
+
+        Args:
+            vertices (int): Número de vértices
+            origen (array(int)): Primer extremo de cada arista
+            destino (array(int)): Segundo extremo de cada arista
+
+        Returns:
+            Grafica: Gráfica en formato CSR
+        """
+        origen = np.asarray(origen, dtype=np.int64)
+        destino = np.asarray(destino, dtype=np.int64)
+        lazos = np.unique(origen[origen == destino]).size
+        menor = np.minimum(origen, destino)
+        mayor = np.maximum(origen, destino)
+        distintos = menor != mayor
+        claves = np.unique(menor[distintos] * vertices + mayor[distintos])
+        u = (claves // vertices).astype(np.int32)
+        v = (claves % vertices).astype(np.int32)
+        fila = np.concatenate((u, v))
+        columna = np.concatenate((v, u))
+        orden = np.argsort(fila.astype(np.int64) * vertices + columna)
+        indices = columna[orden].astype(np.int32)
+        indptr = np.zeros(vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(fila, minlength=vertices), out=indptr[1:])
+        return Grafica(vertices, indptr, indices, u, v, lazos)
+
+    def vecinos(self, vertice):
+        """Regresa los vecinos de un vértice
+
+        Args:
+            vertice (int): Índice del vértice (desde 0)
+
+        Returns:
+            array(int): Índices de los vecinos
+        """
+        return self.indices[self.indptr[vertice]:self.indptr[vertice + 1]]
+
+    def grados(self):
+        """Regresa el grado de cada vértice
+
+        Returns:
+            array(int): Grado de cada vértice
+        """
+        return np.diff(self.indptr)
+
+    def numero_aristas(self):
+        """Regresa el número de aristas distintas (sin lazos)
+
+        Returns:
+            int: Número de aristas
+        """
+        return int(self.u.size)
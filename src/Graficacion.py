@@ -1,18 +1,169 @@
-import matplotlib.pyplot as plt 
+import argparse
+import itertools
+import os
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
 
 class Graficacion:
+    """Gráficas de convergencia sin ventana (backend Agg). Las bitácoras
+    se leen por bloques y se diezman conservando el mínimo y el máximo de
+    cada intervalo, así que la memoria no depende del número de renglones.
+    """
+
+    @staticmethod
+    def lee_bloques(ruta, columna=1, tamanio_bloque=100000):
+        """Lee una bitácora (.txt o .npy) por bloques
+
+        Args:
+            ruta (str): Archivo de la bitácora
+            columna (int, optional): Columna a graficar. Defaults to 1 (mejor).
+            tamanio_bloque (int, optional): Renglones por bloque. Defaults to 100000.
+
+        Yields:
+            tuple: Arreglos x, y del bloque
+        """
+        if ruta.endswith(".npy"):
+            datos = np.load(ruta, mmap_mode='r')
+            for inicio in range(0, len(datos), tamanio_bloque):
+                bloque = np.asarray(datos[inicio:inicio + tamanio_bloque])
+                yield bloque[:, 0], bloque[:, columna]
+            return
+        with open(ruta, 'r') as archivo:
+            lineas = (linea for linea in archivo if linea.strip())
+            while True:
+                lote = list(itertools.islice(lineas, tamanio_bloque))
+                if not lote:
+                    return
+                bloque = np.loadtxt(lote, usecols=(0, columna), ndmin=2)
+                yield bloque[:, 0], bloque[:, 1]
+
+    @staticmethod
+    def cuenta_renglones(ruta):
+        """Cuenta los renglones de una bitácora sin cargarla completa
+
+        Args:
+            ruta (str): Archivo de la bitácora
+
+        Returns:
+            int: Número de renglones
+        """
+        if ruta.endswith(".npy"):
+            return len(np.load(ruta, mmap_mode='r'))
+        with open(ruta, 'r') as archivo:
+            return sum(1 for linea in archivo if linea.strip())
+
+    @staticmethod
+    def diezma(ruta, puntos=2000, columna=1):
+        """Reduce una bitácora a lo más puntos pares (x, y) conservando
+            el mínimo y el máximo de cada intervalo
+
+        Args:
+            ruta (str): Archivo de la bitácora
+            puntos (int, optional): Máximo de puntos a regresar. Defaults to 2000.
+            columna (int, optional): Columna a graficar. Defaults to 1 (mejor).
+
+        Returns:
+            tuple: Arreglos x, y diezmados
+        """
+        renglones = Graficacion.cuenta_renglones(ruta)
+        ancho = max(1, -(-renglones // max(1, puntos // 2)))
+        tamanio_bloque = ancho * max(1, 100000 // ancho)
+        xs = []
+        ys = []
+        for x, y in Graficacion.lee_bloques(ruta, columna, tamanio_bloque):
+            if ancho == 1:
+                xs.append(x)
+                ys.append(y)
+                continue
+            relleno = (-len(y)) % ancho
+            intervalos = np.concatenate((y, np.full(relleno, np.nan))).reshape(-1, ancho)
+            base = np.arange(intervalos.shape[0]) * ancho
+            minimos = base + np.nanargmin(intervalos, axis=1)
+            maximos = base + np.nanargmax(intervalos, axis=1)
+            indices = np.sort(np.unique(np.stack((minimos, maximos), axis=1)))
+            xs.append(x[indices])
+            ys.append(y[indices])
+        if not xs:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(xs), np.concatenate(ys)
+
+    @staticmethod
+    def grafica_bitacoras(rutas, salida, titulo, etiquetas=None, puntos=2000, columna=1):
+        """Grafica una o varias bitácoras en un mismo archivo de imagen
+
+        Args:
+            rutas (list(str)): Bitácoras a graficar
+            salida (str): Imagen de salida; el formato sale de la extensión (png, svg, ...)
+            titulo (str): Título de la gráfica
+            etiquetas (list(str), optional): Etiqueta de cada bitácora. Defaults to el nombre del archivo.
+            puntos (int, optional): Máximo de puntos por bitácora. Defaults to 2000.
+            columna (int, optional): Columna a graficar. Defaults to 1 (mejor).
+
+        Returns:
+            str: Ruta de la imagen generada
+        """
+        if etiquetas is None:
+            etiquetas = [os.path.basename(ruta) for ruta in rutas]
+        figura, ejes = plt.subplots()
+        for ruta, etiqueta in zip(rutas, etiquetas):
+            x, y = Graficacion.diezma(ruta, puntos, columna)
+            ejes.plot(x, y, label=etiqueta, linewidth=1)
+        ejes.set_title(titulo)
+        ejes.set_xlabel("Iteraciones")
+        ejes.set_ylabel("Evaluacion")
+        if len(rutas) > 1:
+            ejes.legend()
+        figura.savefig(salida)
+        plt.close(figura)
+        return salida
+
+    @staticmethod
+    def grafica_curva(valores, salida, titulo, etiqueta_x="Generación", etiqueta_y="Mejor Aptitud"):
+        """Grafica una curva que ya está en memoria
+
+        Args:
+            valores (list(float)): Valores a graficar
+            salida (str): Imagen de salida
+            titulo (str): Título de la gráfica
+            etiqueta_x (str, optional): Etiqueta del eje x. Defaults to "Generación".
+            etiqueta_y (str, optional): Etiqueta del eje y. Defaults to "Mejor Aptitud".
+
+        Returns:
+            str: Ruta de la imagen generada
+        """
+        figura, ejes = plt.subplots()
+        ejes.plot(valores)
+        ejes.set_title(titulo)
+        ejes.set_xlabel(etiqueta_x)
+        ejes.set_ylabel(etiqueta_y)
+        figura.savefig(salida)
+        plt.close(figura)
+        return salida
+
     @staticmethod
-    def grafica_txt(nombre_archivo, titulo, iteraciones):
-        x = []
-        y = []
-        for linea in open(nombre_archivo, 'r'):
-            lineas = [i for i in linea.split()]
-            if int(lineas[0])%int(iteraciones/20) == 0 or int(lineas[0]) == iteraciones-1:
-                x.append(lineas[0])
-                y.append(int(lineas[1]))
-        plt.title(titulo)
-        plt.xlabel("Iteraciones")
-        plt.ylabel("Evaluacion")
-        plt.yticks(y)
-        plt.plot(x,y,marker ='o', c = 'g')
-        plt.show()
\ No newline at end of file
+    def grafica_txt(nombre_archivo, titulo, iteraciones, salida=None):
+        """Grafica la bitácora de una ejecución en una imagen junto a ella
+
+        Args:
+            nombre_archivo (str): Bitácora a graficar
+            titulo (str): Título de la gráfica
+            iteraciones (int): Iteraciones de la ejecución
+            salida (str, optional): Imagen de salida. Defaults to la bitácora con extensión .png.
+
+        Returns:
+            str: Ruta de la imagen generada
+        """
+        if salida is None:
+            salida = os.path.splitext(nombre_archivo)[0] + ".png"
+        return Graficacion.grafica_bitacoras([nombre_archivo], salida, titulo, puntos=min(2000, max(2, 2 * iteraciones)))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grafica una o varias bitácoras de convergencia")
+    parser.add_argument("salida", help="Imagen de salida (.png, .svg, ...)")
+    parser.add_argument("bitacoras", nargs="+", help="Bitácoras .txt o .npy")
+    parser.add_argument("--titulo", default="Convergencia")
+    parser.add_argument("--puntos", type=int, default=2000, help="Máximo de puntos por bitácora")
+    argumentos = parser.parse_args()
+    print(Graficacion.grafica_bitacoras(argumentos.bitacoras, argumentos.salida, argumentos.titulo, puntos=argumentos.puntos))
@@ -0,0 +1,135 @@
+import cProfile
+import time
+
+class EstadisticasGeneracion:
+    """Datos que recibe la función al_generar en cada generación"""
+
+    def __init__(self, generacion, mejor, peor, promedio, tiempo, tiempos, contadores):
+        self.generacion = generacion
+        self.mejor = mejor
+        self.peor = peor
+        self.promedio = promedio
+        self.tiempo = tiempo
+        self.tiempos = tiempos
+        self.contadores = contadores
+
+class _Fase:
+    __slots__ = ("tiempos", "nombre", "inicio")
+
+    def __init__(self, tiempos, nombre):
+        self.tiempos = tiempos
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.tiempos[self.nombre] = self.tiempos.get(self.nombre, 0.0) + time.perf_counter() - self.inicio
+
+class _FaseNula:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        return None
+
+class Instrumentacion:
+    """Temporizadores por fase, contadores y una función opcional que se
+    llama en cada generación con un EstadisticasGeneracion.
+
+    Las búsquedas reciben por defecto NULA, cuyas operaciones no hacen nada,
+    así que el costo cuando no se instrumenta es una llamada vacía por fase.
+    """
+
+    activa = True
+
+    def __init__(self, al_generar=None):
+        self.al_generar = al_generar
+        self.tiempos = {}
+        self.contadores = {}
+        self.inicio = time.perf_counter()
+
+    def fase(self, nombre):
+        """Regresa un administrador de contexto que acumula el tiempo de una fase
+
+        Args:
+            nombre (str): Nombre de la fase (evaluacion, seleccion, cruza, mutacion, ...)
+
+        Returns:
+            object: Administrador de contexto para usar con with
+        """
+        return _Fase(self.tiempos, nombre)
+
+    def cuenta(self, nombre, cantidad=1):
+        """Incrementa un contador
+
+        Args:
+            nombre (str): Nombre del contador
+            cantidad (int, optional): Incremento. Defaults to 1.
+        """
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def generacion(self, numero, mejor, peor, promedio):
+        """Notifica el fin de una generación a la función al_generar
+
+        Args:
+            numero (int): Número de generación
+            mejor (float): Mejor evaluación de la generación
+            peor (float): Peor evaluación vista
+            promedio (float): Promedio de la población
+        """
+        if self.al_generar is not None:
+            self.al_generar(EstadisticasGeneracion(numero, mejor, peor, promedio, time.perf_counter() - self.inicio,
+                                                   self.tiempos, self.contadores))
+
+    def resumen(self):
+        """Regresa un texto con el tiempo de cada fase y los contadores
+
+        Returns:
+            str: Resumen legible de la instrumentación
+        """
+        total = sum(self.tiempos.values()) or 1.0
+        lineas = [f"{fase:<12} {segundos:10.4f} s {segundos / total:7.1%}" for fase, segundos in
+                  sorted(self.tiempos.items(), key=lambda par: -par[1])]
+        lineas += [f"{contador:<24} {valor}" for contador, valor in sorted(self.contadores.items())]
+        return "\n".join(lineas)
+
+class InstrumentacionNula(Instrumentacion):
+    """Instrumentación desactivada: todas sus operaciones son vacías"""
+
+    activa = False
+    _FASE = _FaseNula()
+
+    def __init__(self):
+        super().__init__()
+
+    def fase(self, nombre):
+        return self._FASE
+
+    def cuenta(self, nombre, cantidad=1):
+        pass
+
+    def generacion(self, numero, mejor, peor, promedio):
+        pass
+
+NULA = InstrumentacionNula()
+
+def perfila(ruta, funcion, *argumentos, **opciones):
+    """Ejecuta una función bajo cProfile y guarda las estadísticas en un
+        archivo que se puede leer con pstats
+
+    Args:
+        ruta (str): Archivo de salida
+        funcion (callable): Función a ejecutar
+
+    Returns:
+        object: Lo que regrese la función
+    """
+    perfilador = cProfile.Profile()
+    try:
+        return perfilador.runcall(funcion, *argumentos, **opciones)
+    finally:
+        perfilador.dump_stats(ruta)
@@ -0,0 +1,117 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from Coloracion import Coloracion
+from Grafica import Grafica
+
+_coloracion = None
+_memoria = None
+
+def _inicializa_proceso(nombre, vertices, lazos, tamanios):
+    """Reconstruye la gráfica en cada proceso a partir de la memoria
+        compartida, sin copiar los arreglos.
+
+    Args:
+        nombre (str): Nombre del bloque de memoria compartida
+        vertices (int): Número de vértices
+        lazos (int): Número de lazos de la gráfica
+        tamanios (tuple(int)): Tamaño de indptr, indices, u y v
+    """
+    global _coloracion, _memoria
+    _memoria = shared_memory.SharedMemory(name=nombre)
+    arreglos = _vistas(_memoria.buf, tamanios)
+    _coloracion = Coloracion.desde_grafica(Grafica(vertices, *arreglos, lazos))
+
+def _vistas(buffer, tamanios):
+    arreglos = []
+    desplazamiento = 0
+    for tamanio in tamanios:
+        arreglos.append(np.ndarray(tamanio, dtype=np.int64, buffer=buffer, offset=desplazamiento))
+        desplazamiento += tamanio * 8
+    return arreglos
+
+def _evoluciona_isla(poblacion, generaciones, generador):
+    _coloracion.generador = generador
+    return _coloracion.evoluciona(poblacion, generaciones) + (generador,)
+
+class ModeloIslas:
+    """Algoritmo genético por islas: cada isla es una subpoblación que
+    evoluciona en su propio proceso y cada cierto número de generaciones
+    envía a sus mejores individuos a la siguiente isla (migración en anillo).
+    Cada isla tiene su propio generador, derivado del de la coloración con
+    spawn, que viaja con la población entre procesos; así el resultado no
+    depende de qué proceso evolucione cada isla.
+    """
+
+    def __init__(self, coloracion, islas=4, intervalo_migracion=10, migrantes=2, procesos=None):
+        self.coloracion = coloracion
+        self.islas = islas
+        self.intervalo_migracion = intervalo_migracion
+        self.migrantes = migrantes
+        self.procesos = procesos
+
+    def migra(self, poblaciones, aptitudes):
+        """Reemplaza a los peores individuos de cada isla por los mejores
+            de la isla anterior en el anillo
+
+        Args:
+            poblaciones (list(array(array(int)))): Población de cada isla
+            aptitudes (list(array(int))): Evaluaciones de cada isla
+        """
+        mejores = [np.argsort(a, kind="stable")[:self.migrantes] for a in aptitudes]
+        emigrantes = [(p[m].copy(), a[m].copy()) for p, a, m in zip(poblaciones, aptitudes, mejores)]
+        for i in range(len(poblaciones)):
+            individuos, evaluaciones = emigrantes[i - 1]
+            peores = np.argsort(aptitudes[i], kind="stable")[::-1][:self.migrantes]
+            poblaciones[i][peores] = individuos
+            aptitudes[i][peores] = evaluaciones
+
+    def ejecuta(self, tamanio_poblacion, iteraciones=1000):
+        """Ejecuta el modelo de islas. El criterio de paro de la coloración
+            se revisa entre migraciones, después de al menos una época para
+            que siempre haya poblaciones evaluadas.
+
+        Args:
+            tamanio_poblacion (int): Tamaño de la población de cada isla
+            iteraciones (int, optional): Generaciones totales. Defaults to 1000.
+
+        Returns:
+            tuple: Mejor solución, su evaluación, peor evaluación y promedio
+        """
+        grafica = self.coloracion.grafica
+        arreglos = [np.asarray(a, dtype=np.int64) for a in (grafica.indptr, grafica.indices, grafica.u, grafica.v)]
+        tamanios = tuple(a.size for a in arreglos)
+        memoria = shared_memory.SharedMemory(create=True, size=max(8, 8 * sum(tamanios)))
+        try:
+            for destino, origen in zip(_vistas(memoria.buf, tamanios), arreglos):
+                destino[:] = origen
+            criterio = self.coloracion.criterio
+            criterio.inicia()
+            generadores = self.coloracion.generador.spawn(self.islas)
+            poblaciones = [self.coloracion.genera_poblacion_inicial(tamanio_poblacion, g) for g in generadores]
+            aptitudes = [None] * self.islas
+            peor = 0
+            promedios = []
+            argumentos = (memoria.name, grafica.vertices, grafica.lazos, tamanios)
+            with ProcessPoolExecutor(max_workers=self.procesos, initializer=_inicializa_proceso, initargs=argumentos) as procesos:
+                realizadas = 0
+                while True:
+                    generaciones = min(self.intervalo_migracion, iteraciones - realizadas)
+                    futuros = [procesos.submit(_evoluciona_isla, p, generaciones, g) for p, g in zip(poblaciones, generadores)]
+                    for i, futuro in enumerate(futuros):
+                        poblaciones[i], aptitudes[i], peor_isla, promedios_isla, generadores[i] = futuro.result()
+                        peor = max(peor, peor_isla)
+                        promedios.extend(promedios_isla)
+                    realizadas += generaciones
+                    criterio.cuenta(self.islas * tamanio_poblacion * (generaciones + 1))
+                    criterio.registra(min(int(a.min()) for a in aptitudes), generaciones)
+                    if realizadas < iteraciones and self.islas > 1:
+                        self.migra(poblaciones, aptitudes)
+                    if realizadas >= iteraciones or criterio.termina():
+                        break
+        finally:
+            memoria.close()
+            memoria.unlink()
+        isla = int(np.argmin([a.min() for a in aptitudes]))
+        mejor = int(np.argmin(aptitudes[isla]))
+        return poblaciones[isla][mejor], int(aptitudes[isla][mejor]), peor, float(np.mean(promedios))
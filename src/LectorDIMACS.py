@@ -0,0 +1,148 @@
+import os
+import struct
+import zipfile
+import numpy as np
+from Grafica import Grafica
+
+class LectorDIMACS:
+    """Lector de gráficas en formato DIMACS (.col) con cache binaria.
+
+    La primera lectura interpreta las líneas "e u v" en bloque con NumPy,
+    valida el encabezado "p edge n m" y guarda la gráfica ya construida en
+    un .npz sin compresión junto al archivo. Las lecturas siguientes mapean
+    ese .npz a memoria sin volver a interpretar el texto.
+
+    La firma de la cache incluye VERSION_CACHE junto con el tamaño y la
+    fecha del archivo original; si cambia el formato de los arreglos
+    guardados hay que incrementarla para que las caches viejas se
+    reconstruyan en lugar de cargarse.
+    """
+
+    VERSION_CACHE = 2
+
+    @staticmethod
+    def ruta_cache(archivo):
+        """Regresa la ruta de la cache de un archivo
+
+        Args:
+            archivo (str): Archivo DIMACS
+
+        Returns:
+            str: Ruta del .npz asociado
+        """
+        return archivo + ".npz"
+
+    @staticmethod
+    def lee(archivo, usar_cache=True):
+        """Lee una gráfica DIMACS, usando la cache si es válida
+
+        Args:
+            archivo (str): Archivo DIMACS
+            usar_cache (bool, optional): Leer y escribir la cache .npz. Defaults to True.
+
+        Returns:
+            tuple: Gráfica en formato CSR y número de aristas del encabezado
+        """
+        estado = os.stat(archivo)
+        firma = np.array([LectorDIMACS.VERSION_CACHE, estado.st_size, estado.st_mtime_ns], dtype=np.int64)
+        cache = LectorDIMACS.ruta_cache(archivo)
+        if usar_cache and os.path.exists(cache):
+            try:
+                datos = LectorDIMACS.mapea_npz(cache)
+                if np.array_equal(datos["firma"], firma):
+                    grafica = Grafica(int(datos["vertices"]), datos["indptr"], datos["indices"],
+                                      datos["u"], datos["v"], int(datos["lazos"]))
+                    return grafica, int(datos["aristas"])
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                pass
+        vertices, aristas, origen, destino = LectorDIMACS.interpreta(archivo)
+        grafica = Grafica.desde_aristas(vertices, origen, destino)
+        if usar_cache:
+            LectorDIMACS.guarda_cache(cache, grafica, aristas, firma)
+        return grafica, aristas
+
+    @staticmethod
+    def interpreta(archivo):
+        """Interpreta el texto de un archivo DIMACS
+
+        Args:
+            archivo (str): Archivo DIMACS
+
+        Raises:
+            ValueError: Si falta el encabezado o las aristas no coinciden con él
+
+        Returns:
+            tuple: Vértices, aristas declaradas y los extremos de cada
+            arista (índices desde 0)
+        """
+        with open(archivo, 'r') as datos:
+            lineas = datos.read().splitlines()
+        encabezado = next((linea.split() for linea in lineas if linea.startswith('p')), None)
+        if encabezado is None or len(encabezado) < 4:
+            raise ValueError(f"{archivo}: falta el encabezado 'p edge n m'")
+        vertices = int(encabezado[2])
+        aristas = int(encabezado[3])
+        lineas_aristas = [linea[1:] for linea in lineas if linea.startswith('e')]
+        valores = np.fromstring(" ".join(lineas_aristas), dtype=np.int64, sep=" ")
+        if valores.size != 2 * len(lineas_aristas):
+            raise ValueError(f"{archivo}: hay líneas de aristas mal formadas")
+        if len(lineas_aristas) != aristas:
+            raise ValueError(f"{archivo}: el encabezado declara {aristas} aristas pero hay {len(lineas_aristas)}")
+        valores = valores.reshape(-1, 2) - 1
+        if valores.size and (valores.min() < 0 or valores.max() >= vertices):
+            raise ValueError(f"{archivo}: hay aristas con vértices fuera de 1..{vertices}")
+        return vertices, aristas, valores[:, 0], valores[:, 1]
+
+    @staticmethod
+    def guarda_cache(ruta, grafica, aristas, firma):
+        """Guarda la gráfica en un .npz sin compresión, de forma atómica
+
+        Args:
+            ruta (str): Archivo .npz de salida
+            grafica (Grafica): Gráfica a guardar
+            aristas (int): Aristas declaradas en el encabezado
+            firma (array(int)): Versión de la cache, tamaño y fecha de modificación del archivo original
+        """
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            with open(temporal, 'wb') as salida:
+                np.savez(salida, firma=firma, vertices=grafica.vertices, aristas=aristas, lazos=grafica.lazos,
+                         indptr=grafica.indptr, indices=grafica.indices, u=grafica.u, v=grafica.v)
+            os.replace(temporal, ruta)
+        except OSError:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+
+    @staticmethod
+    def mapea_npz(ruta):
+        """Mapea a memoria los arreglos de un .npz sin compresión
+
+        Args:
+            ruta (str): Archivo .npz
+
+        Raises:
+            ValueError: Si algún arreglo está comprimido
+
+        Returns:
+            dict: Arreglos del archivo, de sólo lectura
+        """
+        arreglos = {}
+        with zipfile.ZipFile(ruta) as comprimido, open(ruta, 'rb') as archivo:
+            for info in comprimido.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"{ruta}: {info.filename} está comprimido")
+                archivo.seek(info.header_offset)
+                local = struct.unpack("<IHHHHHIIIHH", archivo.read(30))
+                archivo.seek(info.header_offset + 30 + local[9] + local[10])
+                version = np.lib.format.read_magic(archivo)
+                if version == (1, 0):
+                    forma, fortran, tipo = np.lib.format.read_array_header_1_0(archivo)
+                else:
+                    forma, fortran, tipo = np.lib.format.read_array_header_2_0(archivo)
+                nombre = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+                if len(forma) == 0 or 0 in forma:
+                    arreglos[nombre] = np.fromfile(archivo, dtype=tipo, count=int(np.prod(forma))).reshape(forma)
+                else:
+                    arreglos[nombre] = np.memmap(ruta, dtype=tipo, mode='r', offset=archivo.tell(),
+                                                 shape=forma, order='F' if fortran else 'C')
+        return arreglos
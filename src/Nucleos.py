@@ -0,0 +1,262 @@
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+    def njit(*argumentos, **opciones):
+        """Sustituto de numba.njit cuando numba no está instalado: deja la función sin compilar"""
+        if len(argumentos) == 1 and callable(argumentos[0]):
+            return argumentos[0]
+        return lambda funcion: funcion
+
+BACKENDS = ("numpy", "numba")
+
+class FlujoMovimientos:
+    """Secuencia de movimientos de recoloreo (vértice, nuevo color) que se
+    sortean por bloques con el generador de la búsqueda.
+
+    Sortear n pares de una vez da los mismos números que sortearlos en
+    varias llamadas más chicas, así que la secuencia no depende del tamaño
+    de los bloques: el backend numpy los consume uno por uno y los núcleos
+    compilados en lotes grandes, y ambos ven exactamente los mismos
+    movimientos. Los movimientos sorteados y no usados forman parte del
+    estado de la búsqueda (ver estado y restaura).
+    """
+
+    def __init__(self, generador, vertices, bloque=4096):
+        self.generador = generador
+        self.vertices = vertices
+        self.bloque = bloque
+        self.movimientos = np.empty((0, 2), dtype=np.int64)
+        self.posicion = 0
+
+    def disponibles(self):
+        """Regresa cuántos movimientos sorteados faltan por usar
+
+        Returns:
+            int: Movimientos disponibles
+        """
+        return len(self.movimientos) - self.posicion
+
+    def asegura(self, cantidad):
+        """Sortea movimientos nuevos si hay menos de cantidad disponibles
+
+        Args:
+            cantidad (int): Movimientos que deben quedar disponibles
+        """
+        faltan = cantidad - self.disponibles()
+        if faltan <= 0:
+            return
+        nuevos = self.generador.integers(0, self.vertices, (max(faltan, self.bloque), 2))
+        nuevos[:, 1] += 1
+        self.movimientos = np.concatenate((self.movimientos[self.posicion:], nuevos))
+        self.posicion = 0
+
+    def pendientes(self, cantidad):
+        """Regresa, sin consumirlos, hasta cantidad de los siguientes movimientos
+            (al menos uno)
+
+        Args:
+            cantidad (int): Máximo de movimientos
+
+        Returns:
+            tuple: Arreglos con los vértices y sus nuevos colores
+        """
+        self.asegura(1)
+        movimientos = self.movimientos[self.posicion:self.posicion + cantidad]
+        return movimientos[:, 0], movimientos[:, 1]
+
+    def avanza(self, cantidad):
+        """Marca como usados los siguientes movimientos
+
+        Args:
+            cantidad (int): Movimientos usados
+        """
+        self.posicion += cantidad
+
+    def toma(self, cantidad):
+        """Consume los siguientes movimientos
+
+        Args:
+            cantidad (int): Número de movimientos
+
+        Returns:
+            tuple: Arreglos con los vértices y sus nuevos colores
+        """
+        self.asegura(cantidad)
+        movimientos = self.movimientos[self.posicion:self.posicion + cantidad]
+        self.posicion += cantidad
+        return movimientos[:, 0], movimientos[:, 1]
+
+    def estado(self):
+        """Regresa los movimientos sorteados que faltan por usar
+
+        Returns:
+            array(array(int)): Movimientos pendientes
+        """
+        return self.movimientos[self.posicion:].copy()
+
+    def restaura(self, movimientos):
+        """Restaura los movimientos pendientes guardados con estado
+
+        Args:
+            movimientos (array(array(int))): Movimientos pendientes
+        """
+        self.movimientos = np.asarray(movimientos, dtype=np.int64).reshape(-1, 2)
+        self.posicion = 0
+
+@njit(cache=True)
+def evalua(u, v, colores, vertices, lazos):
+    """Evaluación de una coloración, igual a Coloracion.evalua"""
+    conflictos = 0
+    for i in range(u.shape[0]):
+        if colores[u[i]] == colores[v[i]]:
+            conflictos += 1
+    usado = np.zeros(vertices + 1, dtype=np.bool_)
+    for i in range(colores.shape[0]):
+        if 1 <= colores[i] <= vertices:
+            usado[colores[i]] = True
+    return 2 * conflictos + lazos + np.count_nonzero(usado)
+
+@njit(cache=True)
+def delta(indptr, indices, colores, histograma, vertice, color):
+    """Cambio en la evaluación al recolorear un vértice, igual a EvaluadorIncremental.delta"""
+    anterior = colores[vertice]
+    if color == anterior:
+        return 0
+    conflictos = 0
+    for k in range(indptr[vertice], indptr[vertice + 1]):
+        vecino = colores[indices[k]]
+        if vecino == color:
+            conflictos += 1
+        elif vecino == anterior:
+            conflictos -= 1
+    usados = 0
+    if histograma[anterior] == 1:
+        usados -= 1
+    if histograma[color] == 0:
+        usados += 1
+    return 2 * conflictos + usados
+
+@njit(cache=True)
+def aplica(indptr, indices, colores, histograma, conflictos, totales, vertice, color):
+    """Recolorea un vértice, igual a EvaluadorIncremental.aplica. totales
+        guarda las aristas en conflicto y los colores usados."""
+    anterior = colores[vertice]
+    if color == anterior:
+        return anterior
+    entran = 0
+    salen = 0
+    for k in range(indptr[vertice], indptr[vertice + 1]):
+        w = indices[k]
+        if colores[w] == anterior:
+            conflictos[w] -= 1
+            salen += 1
+        elif colores[w] == color:
+            conflictos[w] += 1
+            entran += 1
+    conflictos[vertice] = entran
+    totales[0] += entran - salen
+    if histograma[anterior] == 1:
+        totales[1] -= 1
+    if histograma[color] == 0:
+        totales[1] += 1
+    histograma[anterior] -= 1
+    histograma[color] += 1
+    colores[vertice] = color
+    return anterior
+
+@njit(cache=True)
+def continua(paro, probados):
+    """Revisa el criterio de paro antes de una iteración. paro guarda el
+        objetivo (-1 si no hay), el límite de movimientos probados, el máximo
+        de iteraciones sin mejora, la mejor evaluación y las iteraciones sin
+        mejora, como CriterioParo."""
+    return paro[3] > paro[0] and paro[4] < paro[2] and probados < paro[1]
+
+@njit(cache=True)
+def registra(paro, evaluacion):
+    """Actualiza la mejor evaluación y las iteraciones sin mejora de paro"""
+    if evaluacion < paro[3]:
+        paro[3] = evaluacion
+        paro[4] = 0
+    else:
+        paro[4] += 1
+
+@njit(cache=True)
+def escalada(indptr, indices, colores, histograma, conflictos, totales, lazos, movimientos, posicion,
+             hasta, intentos, paro, progreso):
+    """Iteraciones de la búsqueda por escalada hasta la iteración hasta,
+        hasta que queden menos de intentos movimientos o hasta que se cumpla
+        el criterio de paro (ver continua). progreso guarda
+        iteración, peor, suma de evaluaciones, movimientos probados y aceptados.
+        Regresa la posición del siguiente movimiento sin usar."""
+    iteracion, peor, suma, probados, aceptados = progreso[0], progreso[1], progreso[2], progreso[3], progreso[4]
+    while iteracion < hasta and continua(paro, probados) and movimientos.shape[0] - posicion >= intentos:
+        for _ in range(intentos):
+            vertice = movimientos[posicion, 0]
+            color = movimientos[posicion, 1]
+            posicion += 1
+            probados += 1
+            if delta(indptr, indices, colores, histograma, vertice, color) <= 0:
+                aplica(indptr, indices, colores, histograma, conflictos, totales, vertice, color)
+                aceptados += 1
+                break
+        evaluacion = 2 * totales[0] + lazos + totales[1]
+        if peor < evaluacion:
+            peor = evaluacion
+        suma += evaluacion
+        iteracion += 1
+        registra(paro, evaluacion)
+    progreso[0], progreso[1], progreso[2], progreso[3], progreso[4] = iteracion, peor, suma, probados, aceptados
+    return posicion
+
+@njit(cache=True)
+def iterada(indptr, indices, colores, histograma, conflictos, totales, lazos, movimientos, posicion,
+            hasta, cantidad, intentos, paro, progreso, deshacer):
+    """Iteraciones de la búsqueda local iterada (perturbación de cantidad
+        movimientos, un movimiento de escalada y se deshace todo si empeora)
+        hasta la iteración hasta, hasta que queden menos de cantidad + intentos
+        movimientos o hasta que se cumpla el criterio de paro (ver continua).
+        progreso guarda iteración, mejor, peor, suma, probados y
+        aceptados; deshacer debe tener lugar para cantidad + 1 movimientos.
+        Regresa la posición del siguiente movimiento sin usar."""
+    iteracion, mejor, peor, suma = progreso[0], progreso[1], progreso[2], progreso[3]
+    probados, aceptados = progreso[4], progreso[5]
+    while iteracion < hasta and continua(paro, probados) and movimientos.shape[0] - posicion >= cantidad + intentos:
+        aplicados = 0
+        for _ in range(cantidad):
+            vertice = movimientos[posicion, 0]
+            deshacer[aplicados, 0] = vertice
+            deshacer[aplicados, 1] = aplica(indptr, indices, colores, histograma, conflictos, totales,
+                                            vertice, movimientos[posicion, 1])
+            aplicados += 1
+            posicion += 1
+        for _ in range(intentos):
+            vertice = movimientos[posicion, 0]
+            color = movimientos[posicion, 1]
+            posicion += 1
+            probados += 1
+            if delta(indptr, indices, colores, histograma, vertice, color) <= 0:
+                deshacer[aplicados, 0] = vertice
+                deshacer[aplicados, 1] = aplica(indptr, indices, colores, histograma, conflictos, totales, vertice, color)
+                aplicados += 1
+                aceptados += 1
+                break
+        evaluacion = 2 * totales[0] + lazos + totales[1]
+        if evaluacion <= mejor:
+            mejor = evaluacion
+        else:
+            for k in range(aplicados - 1, -1, -1):
+                aplica(indptr, indices, colores, histograma, conflictos, totales, deshacer[k, 0], deshacer[k, 1])
+            if peor < evaluacion:
+                peor = evaluacion
+        suma += evaluacion
+        iteracion += 1
+        registra(paro, mejor)
+    progreso[0], progreso[1], progreso[2], progreso[3] = iteracion, mejor, peor, suma
+    progreso[4], progreso[5] = probados, aceptados
+    return posicion
@@ -1,48 +1,49 @@
-import random
+import argparse
+import csv
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from CriterioParo import CriterioParo
 from Funciones import Funciones
+from Graficacion import Graficacion
+from Instrumentacion import NULA, Instrumentacion, perfila
+from PuntoControl import PuntoControl
+from Seleccion import Seleccion
 
 class AlgoritmoGenetico:
     
-    def __init__(self, funcion_objetivo, dominio, tamano_poblacion=100, num_generaciones=100, prob_mutacion=0.1, num_puntos_cruza=2, elitismo=True):
+    def __init__(self, funcion_objetivo, dominio, tamano_poblacion=100, num_generaciones=100, prob_mutacion=0.1, num_puntos_cruza=2, elitismo=True, dimension=None, seleccion="ruleta", instrumentacion=None, punto_control=None, generador=None, criterio=None):
         self.funcion_objetivo = funcion_objetivo
         self.dominio = dominio
+        self.dimension = len(dominio) if dimension is None else dimension
         self.tamano_poblacion = tamano_poblacion
         self.num_generaciones = num_generaciones
         self.prob_mutacion = prob_mutacion
         self.num_puntos_cruza = num_puntos_cruza
         self.elitismo = elitismo
+        self.seleccion = seleccion
+        self.instrumentacion = NULA if instrumentacion is None else instrumentacion
+        self.punto_control = punto_control
+        self.generador = np.random.default_rng(generador)
+        self.criterio = CriterioParo() if criterio is None else criterio
 
     def inicializar_poblacion(self):
-        poblacion = []
-        for _ in range(self.tamano_poblacion):
-            solucion = [random.uniform(self.dominio[0], self.dominio[1]) for _ in range(len(self.dominio))]
-            poblacion.append(solucion)
-        return poblacion
+        return self.generador.uniform(self.dominio[0], self.dominio[1], (self.tamano_poblacion, self.dimension)).tolist()
 
     def evaluar_poblacion(self, poblacion):
+        self.instrumentacion.cuenta("evaluaciones", len(poblacion))
+        self.criterio.cuenta(len(poblacion))
         evaluaciones = []
         for individuo in poblacion:
             evaluacion = self.funcion_objetivo(individuo)
             evaluaciones.append((individuo, evaluacion))
         return evaluaciones
 
-    def seleccionar_padres(self, evaluaciones):
-        total_fitness = sum(1 / evaluacion[1] for evaluacion in evaluaciones)
-        padres_seleccionados = []
-        while len(padres_seleccionados) < 2:
-            punto = random.uniform(0, total_fitness)
-            acumulado = 0
-            for individuo, evaluacion in evaluaciones:
-                acumulado += 1 / evaluacion
-                if acumulado > punto:
-                    padres_seleccionados.append(individuo)
-                    break
-        return padres_seleccionados
+    def seleccionar_padres(self, aptitudes, cantidad):
+        return Seleccion.selecciona(self.seleccion, aptitudes, cantidad, self.generador)
 
     def cruzar_padres(self, padre1, padre2):
-        puntos_cruza = sorted(random.sample(range(len(padre1)), self.num_puntos_cruza))
+        puntos_cruza = set(self.generador.choice(len(padre1), self.num_puntos_cruza, replace=False).tolist())
         hijo1 = []
         hijo2 = []
         for i in range(len(padre1)):
@@ -55,9 +56,10 @@ class AlgoritmoGenetico:
         return hijo1, hijo2
 
     def mutar(self, individuo):
-        for i in range(len(individuo)):
-            if random.random() < self.prob_mutacion:
-                individuo[i] = random.uniform(self.dominio[0], self.dominio[1])
+        mutados = np.flatnonzero(self.generador.random(len(individuo)) < self.prob_mutacion)
+        nuevos = self.generador.uniform(self.dominio[0], self.dominio[1], mutados.size)
+        for i, valor in zip(mutados.tolist(), nuevos.tolist()):
+            individuo[i] = valor
         return individuo
 
     def reemplazar_generacional(self, poblacion, evaluaciones):
@@ -65,11 +67,17 @@ class AlgoritmoGenetico:
         if self.elitismo:
             mejor_solucion = min(evaluaciones, key=lambda x: x[1])[0]
             nueva_generacion.append(mejor_solucion)
-        while len(nueva_generacion) < self.tamano_poblacion:
-            padres = self.seleccionar_padres(evaluaciones)
-            hijos = self.cruzar_padres(padres[0], padres[1])
-            hijo1_mutado = self.mutar(hijos[0])
-            hijo2_mutado = self.mutar(hijos[1])
+        aptitudes = np.array([evaluacion for _, evaluacion in evaluaciones])
+        parejas = max(0, self.tamano_poblacion - len(nueva_generacion) + 1) // 2
+        medidor = self.instrumentacion
+        with medidor.fase("seleccion"):
+            indices = self.seleccionar_padres(aptitudes, 2 * parejas)
+        for i, j in zip(indices[:parejas], indices[parejas:]):
+            with medidor.fase("cruza"):
+                hijos = self.cruzar_padres(evaluaciones[i][0], evaluaciones[j][0])
+            with medidor.fase("mutacion"):
+                hijo1_mutado = self.mutar(hijos[0])
+                hijo2_mutado = self.mutar(hijos[1])
             nueva_generacion.extend([hijo1_mutado, hijo2_mutado])
         return nueva_generacion
 
@@ -80,55 +88,234 @@ class AlgoritmoGenetico:
         else:
             return peor 
 
-    def calcula_promedio(self, evaluaciones, promedio_actual):
+    def calcula_promedio(self, evaluaciones, promedio_actual, generacion):
+        """Promedio de la aptitud de la población en todas las generaciones
+            hasta ésta, a partir del de las anteriores
+
+        Args:
+            evaluaciones (list(tuple)): Individuo y aptitud de la generación
+            promedio_actual (float): Promedio de las generaciones anteriores
+            generacion (int): Número de la generación, desde 0
+
+        Returns:
+            float: Promedio actualizado
+        """
         suma = 0
         for i in range(len(evaluaciones)):
             suma += evaluaciones[i][1]
-        suma /= len(evaluaciones)    
-        promedio_actual += suma
-        return promedio_actual/2
+        suma /= len(evaluaciones)
+        return promedio_actual + (suma - promedio_actual) / (generacion + 1)
+
+    def reanudar(self):
+        """Regresa el estado inicial de ejecutar: el guardado en el punto de
+            control si hay uno, o una población nueva. También reinicia o
+            restaura el criterio de paro.
+
+        Returns:
+            dict: Población, mejor aptitud por generación, mejor, peor, promedio y generación
+        """
+        estado = None if self.punto_control is None else self.punto_control.reanuda(type(self).__name__, self.generador)
+        self.criterio.inicia()
+        if estado is None:
+            estado = {"poblacion": self.inicializar_poblacion(), "mejor_aptitud_por_generacion": [],
+                      "mejor": float("inf"), "peor": 0, "promedio": 0, "generacion": 0}
+        else:
+            self.criterio.restaura(estado["criterio"])
+        return estado
+
+    def guardar(self, poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio, generacion, final=False):
+        """Guarda el estado de ejecutar en el punto de control, si ya toca o si es el final"""
+        if self.punto_control is None:
+            return
+        def datos():
+            return {"poblacion": poblacion, "mejor_aptitud_por_generacion": mejor_aptitud_por_generacion,
+                    "mejor": mejor, "peor": peor, "promedio": promedio, "generacion": generacion,
+                    "criterio": self.criterio.estado()}
+        if final:
+            self.punto_control.guarda(type(self).__name__, datos(), self.generador)
+        else:
+            self.punto_control.revisa(type(self).__name__, datos, self.generador)
 
     def ejecutar(self):
-        poblacion = self.inicializar_poblacion()
-        mejor_aptitud_por_generacion = []
-        peor = 0
-        promedio = 0
-        mejor = float("inf")
-        for _ in range(self.num_generaciones):
-            evaluaciones = self.evaluar_poblacion(poblacion)
+        estado = self.reanudar()
+        poblacion = estado["poblacion"]
+        mejor_aptitud_por_generacion = estado["mejor_aptitud_por_generacion"]
+        peor, promedio, mejor = estado["peor"], estado["promedio"], estado["mejor"]
+        medidor = self.instrumentacion
+        generacion = estado["generacion"]
+        while generacion < self.num_generaciones and not self.criterio.termina():
+            with medidor.fase("evaluacion"):
+                evaluaciones = self.evaluar_poblacion(poblacion)
             mejor_aptitud = min(evaluaciones, key=lambda x: x[1])[1]
             if mejor > mejor_aptitud:
                 mejor = mejor_aptitud
             peor = self.encuentra_peor(evaluaciones, peor)
-            promedio += self.calcula_promedio(evaluaciones, promedio)
+            promedio = self.calcula_promedio(evaluaciones, promedio, generacion)
             mejor_aptitud_por_generacion.append(mejor_aptitud)
+            medidor.generacion(generacion, mejor_aptitud, peor, promedio)
+            self.criterio.registra(mejor)
             poblacion = self.reemplazar_generacional(poblacion, evaluaciones)
+            generacion += 1
+            self.guardar(poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio, generacion)
+        self.guardar(poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio, generacion, final=True)
         return poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio
 
-def graficar_evolucion(funcion_objetivo, dominio, titulo):
-    ag = AlgoritmoGenetico(funcion_objetivo, dominio)
+class AlgoritmoGeneticoVectorizado(AlgoritmoGenetico):
+    """Mismo algoritmo que AlgoritmoGenetico, pero la población se guarda
+    como un arreglo (tamano_poblacion, dimension) y la inicialización, la
+    selección por ruleta, la cruza por puntos, la mutación y el reemplazo
+    elitista se hacen con operaciones sobre arreglos completos.
+    La función objetivo debe aceptar la matriz de la población, como las de Funciones.
+    """
+
+    def inicializar_poblacion(self):
+        return self.generador.uniform(self.dominio[0], self.dominio[1], size=(self.tamano_poblacion, self.dimension))
+
+    def evaluar_poblacion(self, poblacion):
+        self.instrumentacion.cuenta("evaluaciones", len(poblacion))
+        self.criterio.cuenta(len(poblacion))
+        return np.asarray(self.funcion_objetivo(poblacion), dtype=np.float64)
+
+    def cruzar_padres(self, padres1, padres2):
+        """Intercambia los genes en num_puntos_cruza posiciones distintas de cada pareja"""
+        aleatorios = self.generador.random(padres1.shape)
+        puntos = np.argpartition(aleatorios, self.num_puntos_cruza - 1, axis=1)[:, :self.num_puntos_cruza]
+        mascara = np.zeros(padres1.shape, dtype=bool)
+        np.put_along_axis(mascara, puntos, True, axis=1)
+        return np.where(mascara, padres2, padres1), np.where(mascara, padres1, padres2)
+
+    def mutar(self, poblacion):
+        mascara = self.generador.random(poblacion.shape) < self.prob_mutacion
+        poblacion[mascara] = self.generador.uniform(self.dominio[0], self.dominio[1], size=np.count_nonzero(mascara))
+        return poblacion
+
+    def reemplazar_generacional(self, poblacion, aptitudes):
+        elite = 1 if self.elitismo else 0
+        parejas = (self.tamano_poblacion - elite + 1) // 2
+        medidor = self.instrumentacion
+        with medidor.fase("seleccion"):
+            indices = self.seleccionar_padres(aptitudes, 2 * parejas)
+        with medidor.fase("cruza"):
+            hijos1, hijos2 = self.cruzar_padres(poblacion[indices[:parejas]], poblacion[indices[parejas:]])
+        with medidor.fase("mutacion"):
+            hijos = self.mutar(np.concatenate((hijos1, hijos2)))
+        nueva_generacion = np.empty_like(poblacion)
+        if self.elitismo:
+            nueva_generacion[0] = poblacion[np.argmin(aptitudes)]
+        nueva_generacion[elite:] = hijos[:self.tamano_poblacion - elite]
+        return nueva_generacion
+
+    def ejecutar(self):
+        estado = self.reanudar()
+        poblacion = estado["poblacion"]
+        mejor_aptitud_por_generacion = estado["mejor_aptitud_por_generacion"]
+        peor, promedio, mejor = estado["peor"], estado["promedio"], estado["mejor"]
+        medidor = self.instrumentacion
+        generacion = estado["generacion"]
+        while generacion < self.num_generaciones and not self.criterio.termina():
+            with medidor.fase("evaluacion"):
+                aptitudes = self.evaluar_poblacion(poblacion)
+            mejor_aptitud = float(aptitudes.min())
+            if mejor > mejor_aptitud:
+                mejor = mejor_aptitud
+            peor = max(peor, float(aptitudes.max()))
+            promedio += (float(aptitudes.mean()) - promedio) / (generacion + 1)
+            mejor_aptitud_por_generacion.append(mejor_aptitud)
+            medidor.generacion(generacion, mejor_aptitud, peor, promedio)
+            self.criterio.registra(mejor)
+            poblacion = self.reemplazar_generacional(poblacion, aptitudes)
+            generacion += 1
+            self.guardar(poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio, generacion)
+        self.guardar(poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio, generacion, final=True)
+        return poblacion, mejor_aptitud_por_generacion, mejor, peor, promedio
+
+def graficar_evolucion(funcion_objetivo, dominio, titulo, vectorizado=False, seleccion="ruleta", salida="evolucion.png",
+                       instrumentacion=None, punto_control=None, generador=None, criterio=None):
+    clase = AlgoritmoGeneticoVectorizado if vectorizado else AlgoritmoGenetico
+    ag = clase(funcion_objetivo, dominio, seleccion=seleccion, instrumentacion=instrumentacion, punto_control=punto_control,
+               generador=generador, criterio=criterio)
     _, mejor_aptitud_por_generacion, mejor,  peor, promedio = ag.ejecutar()
-    plt.plot(mejor_aptitud_por_generacion)
-    plt.title(titulo)
-    plt.xlabel("Generación")
-    plt.ylabel("Mejor Aptitud")
-    plt.show()
+    Graficacion.grafica_curva(mejor_aptitud_por_generacion, salida, titulo)
     return mejor_aptitud_por_generacion, mejor,  peor, promedio
 
-def ejecutar_experimentos(funciones, dominios, num_ejecuciones=30):
+def ejecutar_corrida(nombre_funcion, funcion, dominio, ejecucion, semilla, vectorizado=False, seleccion="ruleta", criterio=None):
+    """Ejecuta una corrida independiente del algoritmo genético con su propia semilla
+
+    Args:
+        nombre_funcion (str): Nombre de la función objetivo
+        funcion (callable): Función objetivo
+        dominio (tuple): Dominio de la función
+        ejecucion (int): Número de la corrida
+        semilla (int): Semilla de la corrida
+        vectorizado (bool, optional): Usar AlgoritmoGeneticoVectorizado. Defaults to False.
+        seleccion (str, optional): ruleta, universal o torneo. Defaults to "ruleta".
+        criterio (CriterioParo, optional): Criterio de paro de la corrida. Defaults to None.
+
+    Returns:
+        dict: Resultados de la corrida, incluida la mejor aptitud por generación
+    """
+    clase = AlgoritmoGeneticoVectorizado if vectorizado else AlgoritmoGenetico
+    ag = clase(funcion, dominio, seleccion=seleccion, generador=semilla, criterio=criterio)
+    _, mejor_aptitud_por_generacion, mejor, peor, promedio = ag.ejecutar()
+    return {"funcion": nombre_funcion, "ejecucion": ejecucion, "semilla": semilla,
+            "mejor": mejor, "peor": peor, "promedio": promedio,
+            "curva": mejor_aptitud_por_generacion}
+
+def escribir_tabla(tabla, ruta):
+    """Escribe una tabla por columnas en formato CSV
+
+    Args:
+        tabla (dict(str, list)): Columnas de la tabla, todas del mismo largo
+        ruta (str): Archivo de salida
+    """
+    columnas = list(tabla)
+    with open(ruta, 'w', newline='') as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(columnas)
+        escritor.writerows(zip(*(tabla[c] for c in columnas)))
+
+def ejecutar_experimentos(funciones, dominios, num_ejecuciones=30, procesos=None, semilla=0, salida=None, vectorizado=False, seleccion="ruleta",
+                          criterio=None):
+    """Ejecuta num_ejecuciones corridas independientes por función, repartidas
+        en un conjunto de procesos. La semilla de cada corrida se deriva de
+        semilla con SeedSequence, así que los resultados no dependen del
+        número de procesos.
+
+    Args:
+        funciones (dict): Funciones objetivo por nombre
+        dominios (dict): Dominio de cada función
+        num_ejecuciones (int, optional): Corridas por función. Defaults to 30.
+        procesos (int, optional): Procesos a usar, None para todos los núcleos. Defaults to None.
+        semilla (int, optional): Semilla base del experimento. Defaults to 0.
+        salida (str, optional): Archivo CSV donde escribir la tabla de resultados. Defaults to None.
+        vectorizado (bool, optional): Usar AlgoritmoGeneticoVectorizado. Defaults to False.
+        seleccion (str, optional): ruleta, universal o torneo. Defaults to "ruleta".
+        criterio (CriterioParo, optional): Criterio de paro de cada corrida (cada una recibe su copia). Defaults to None.
+
+    Returns:
+        tuple: Resumen por función (mejor, peor, promedio y desviación estándar
+        de la mejor aptitud) y la tabla de resultados por columnas
+    """
+    nombres = list(funciones)
+    semillas = np.random.SeedSequence(semilla).spawn(len(nombres) * num_ejecuciones)
+    tareas = [(nombre, funciones[nombre], dominios[nombre], ejecucion,
+               int(semillas[i * num_ejecuciones + ejecucion].generate_state(1)[0]), vectorizado, seleccion, criterio)
+              for i, nombre in enumerate(nombres) for ejecucion in range(num_ejecuciones)]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        corridas = list(ejecutor.map(ejecutar_corrida, *zip(*tareas)))
+    tabla = {columna: [corrida[columna] for corrida in corridas]
+             for columna in ("funcion", "ejecucion", "semilla", "mejor", "peor", "promedio")}
+    generaciones = max(len(corrida["curva"]) for corrida in corridas)
+    for g in range(generaciones):
+        tabla[f"generacion_{g}"] = [corrida["curva"][g] if g < len(corrida["curva"]) else "" for corrida in corridas]
     resultados = {}
-    for nombre_funcion, funcion in funciones.items():
-        resultados[nombre_funcion] = {"mejor": float('inf'), "peor": float('-inf'), "promedio": 0}
-        promedios = []
-        for _ in range(num_ejecuciones):
-            ag = AlgoritmoGenetico(funcion, dominios[nombre_funcion])
-            _, mejor_aptitud_por_generacion = ag.ejecutar()
-            mejor_aptitud = min(mejor_aptitud_por_generacion)
-            resultados[nombre_funcion]["mejor"] = min(resultados[nombre_funcion]["mejor"], mejor_aptitud)
-            resultados[nombre_funcion]["peor"] = max(resultados[nombre_funcion]["peor"], mejor_aptitud)
-            promedios.append(mejor_aptitud)
-        resultados[nombre_funcion]["promedio"] = sum(promedios) / num_ejecuciones
-    return resultados
+    for nombre in nombres:
+        mejores = np.array([c["mejor"] for c in corridas if c["funcion"] == nombre])
+        resultados[nombre] = {"mejor": float(mejores.min()), "peor": float(mejores.max()),
+                              "promedio": float(mejores.mean()), "desviacion": float(mejores.std())}
+    if salida is not None:
+        escribir_tabla(tabla, salida)
+    return resultados, tabla
 
 
 dominios = {
@@ -150,13 +337,47 @@ funciones = {
 
 
 if __name__ == "__main__":
-    import sys
+    parser = argparse.ArgumentParser(description="Algoritmo genético para optimización continua")
+    parser.add_argument("funcion", help="sphere, rastrigin, ackley, griewank, rosenbrock o experimentos")
+    parser.add_argument("--ejecuciones", type=int, default=30, help="Corridas por función (solo experimentos)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos a usar (solo experimentos)")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla del generador (en experimentos, semilla base; 0 por defecto)")
+    parser.add_argument("--salida", default="resultados.csv", help="Archivo CSV de resultados (solo experimentos)")
+    parser.add_argument("--vectorizado", action="store_true", help="Usar el motor con la población en un arreglo de NumPy")
+    parser.add_argument("--grafica", default=None, help="Imagen de la evolución (por defecto evolucion_<funcion>.png)")
+    parser.add_argument("--seleccion", choices=["ruleta", "universal", "torneo"], default="ruleta", help="Esquema de selección de padres")
+    parser.add_argument("--checkpoint", default=None, help="Archivo de punto de control (no aplica a experimentos)")
+    parser.add_argument("--checkpoint-segundos", type=float, default=5.0, help="Segundos entre puntos de control")
+    parser.add_argument("--resume", action="store_true", help="Reanudar desde el archivo de --checkpoint si existe")
+    parser.add_argument("--objetivo", type=float, default=None, help="Terminar al llegar a esta aptitud")
+    parser.add_argument("--sin-mejora", type=int, default=None, help="Terminar tras estas generaciones sin mejora")
+    parser.add_argument("--max-evaluaciones", type=int, default=None, help="Terminar tras estas evaluaciones de la función")
+    parser.add_argument("--tiempo", type=float, default=None, help="Terminar tras estos segundos (por corrida)")
+    parser.add_argument("--instrumentar", action="store_true", help="Mostrar el tiempo por fase y los contadores")
+    parser.add_argument("--profile", default=None, help="Guardar un perfil de cProfile (pstats) en este archivo")
+    argumentos = parser.parse_args()
 
-    if len(sys.argv) != 2:
-        print("Uso: python Optimizacion_Cont.py <funcion>")
-        sys.exit(1)
+    funcion_seleccionada = argumentos.funcion
+    criterio = CriterioParo(argumentos.objetivo, argumentos.sin_mejora, argumentos.max_evaluaciones, argumentos.tiempo)
+
+    if argumentos.resume and argumentos.checkpoint is None:
+        parser.error("--resume necesita --checkpoint")
+    if argumentos.checkpoint is not None and funcion_seleccionada == "experimentos":
+        parser.error("--checkpoint y --resume no aplican a experimentos")
+
+    def ejecuta(funcion, *parametros):
+        if argumentos.profile is not None:
+            return perfila(argumentos.profile, funcion, *parametros)
+        return funcion(*parametros)
 
-    funcion_seleccionada = sys.argv[1]
+    if funcion_seleccionada == "experimentos":
+        resultados, _ = ejecuta(ejecutar_experimentos, funciones, dominios, argumentos.ejecuciones,
+                                argumentos.procesos, argumentos.semilla or 0, argumentos.salida,
+                                argumentos.vectorizado, argumentos.seleccion, criterio)
+        for nombre, resultado in resultados.items():
+            print(f"Función {nombre}. Mejor: {resultado['mejor']}. Peor: {resultado['peor']}. "
+                  f"Promedio: {resultado['promedio']}. Desviación: {resultado['desviacion']}")
+        sys.exit(0)
 
     if funcion_seleccionada not in funciones:
         print("La función seleccionada no está disponible.")
@@ -166,5 +387,17 @@ if __name__ == "__main__":
     dominio = dominios[funcion_seleccionada]
 
     titulo = f"Evolución de Aptitud para {funcion_seleccionada}"
-    mejor_aptitud_por_generacion, mejor, peor, promedio = graficar_evolucion(funcion_objetivo, dominio, titulo)
-    print(f"Función {funcion_seleccionada}. Mejor: {mejor}. Peor: {peor}. Promedio: {promedio}")
\ No newline at end of file
+    instrumentacion = Instrumentacion() if argumentos.instrumentar else None
+    punto_control = None
+    if argumentos.checkpoint is not None:
+        punto_control = PuntoControl(argumentos.checkpoint, argumentos.checkpoint_segundos, argumentos.resume)
+    mejor_aptitud_por_generacion, mejor, peor, promedio = ejecuta(graficar_evolucion, funcion_objetivo, dominio, titulo,
+                                                                  argumentos.vectorizado, argumentos.seleccion,
+                                                                  argumentos.grafica or f"evolucion_{funcion_seleccionada}.png",
+                                                                  instrumentacion, punto_control, argumentos.semilla,
+                                                                  criterio)
+    print(f"Función {funcion_seleccionada}. Mejor: {mejor}. Peor: {peor}. Promedio: {promedio}")
+    if criterio.motivo is not None:
+        print(f"El algoritmo terminó antes de tiempo por: {criterio.motivo}")
+    if instrumentacion is not None:
+        print(instrumentacion.resumen())
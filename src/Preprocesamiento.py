@@ -0,0 +1,171 @@
+import numpy as np
+from Grafica import Grafica
+
+class Preprocesamiento:
+    """Reducción de una gráfica antes de colorearla y cota inferior del
+    número de colores.
+
+    Primero busca un clique grande de forma voraz; su tamaño es una cota
+    inferior del número cromático y sus vértices nunca se eliminan. Después
+    alterna, hasta que ya no cambia nada, dos reglas:
+
+    - Se elimina un vértice con grado menor que el número de colores
+      objetivo k: cuando el resto está coloreado, entre sus vecinos hay
+      menos de k colores y siempre queda uno libre de 1 a k.
+    - Se elimina un vértice u dominado por otro v no adyacente (todo vecino
+      de u es vecino de v): u puede tomar el color de v sin agregar
+      conflictos.
+
+    Las búsquedas trabajan sobre la gráfica reducida y expande reconstruye
+    la coloración de la gráfica original deshaciendo las eliminaciones en
+    orden inverso. Con k igual a la cota, una coloración sin conflictos de
+    la reducida con la cota de colores se expande a una coloración óptima.
+    """
+
+    def __init__(self, grafica, colores=None, intentos_clique=64, dominados=True):
+        """
+        Args:
+            grafica (Grafica): Gráfica original
+            colores (int, optional): Número de colores objetivo k. Defaults to la cota del clique.
+            intentos_clique (int, optional): Vértices de mayor grado desde los que se busca un clique. Defaults to 64.
+            dominados (bool, optional): Eliminar también los vértices dominados. Defaults to True.
+        """
+        self.grafica = grafica
+        indptr = grafica.indptr.tolist()
+        indices = grafica.indices.tolist()
+        self.vecinos = [indices[indptr[v]:indptr[v + 1]] for v in range(grafica.vertices)]
+        self.clique = self.clique_voraz(intentos_clique)
+        self.cota = len(self.clique)
+        self.colores = self.cota if colores is None else colores
+        # (vértice, vértice que lo domina o -1 si se eliminó por grado), en orden de eliminación
+        self.eliminados = []
+        self.vertices = self._reduce(dominados)
+        nuevos = np.full(grafica.vertices, -1, dtype=np.int64)
+        nuevos[self.vertices] = np.arange(self.vertices.size)
+        conservadas = (nuevos[grafica.u] >= 0) & (nuevos[grafica.v] >= 0)
+        self.reducida = Grafica.desde_aristas(int(self.vertices.size), nuevos[grafica.u[conservadas]],
+                                              nuevos[grafica.v[conservadas]])
+        self.reducida.lazos = grafica.lazos
+
+    def clique_voraz(self, intentos):
+        """Busca un clique empezando desde los vértices de mayor grado y
+            agregando cada vez al candidato de mayor grado que es vecino de
+            todos los vértices del clique
+
+        Args:
+            intentos (int): Número de vértices iniciales a probar
+
+        Returns:
+            array(int): Vértices del clique más grande encontrado
+        """
+        grados = self.grafica.grados()
+        orden = np.argsort(-grados, kind="stable").tolist()
+        grados = grados.tolist()
+        mejor = orden[:1]
+        for inicio in orden[:intentos]:
+            if grados[inicio] < len(mejor):
+                break
+            clique = [inicio]
+            candidatos = set(self.vecinos[inicio])
+            while candidatos and len(clique) + len(candidatos) > len(mejor):
+                v = max(candidatos, key=lambda w: (grados[w], -w))
+                clique.append(v)
+                candidatos.intersection_update(self.vecinos[v])
+            if len(clique) > len(mejor):
+                mejor = clique
+        return np.array(sorted(mejor), dtype=np.int64)
+
+    def _reduce(self, dominados):
+        """Aplica las reglas de eliminación hasta que ya no cambia nada
+
+        Returns:
+            array(int): Vértices originales que quedan, en orden
+        """
+        restantes = [set(vecinos) for vecinos in self.vecinos]
+        presentes = [True] * self.grafica.vertices
+        protegidos = set(self.clique.tolist())
+
+        def elimina(v, dominante):
+            presentes[v] = False
+            for w in restantes[v]:
+                restantes[w].discard(v)
+            restantes[v] = set()
+            self.eliminados.append((v, dominante))
+
+        cambio = True
+        while cambio:
+            pendientes = [v for v in range(self.grafica.vertices)
+                          if presentes[v] and v not in protegidos and len(restantes[v]) < self.colores]
+            while pendientes:
+                v = pendientes.pop()
+                if not presentes[v]:
+                    continue
+                vecinos = list(restantes[v])
+                elimina(v, -1)
+                pendientes.extend(w for w in vecinos if w not in protegidos and len(restantes[w]) < self.colores)
+            cambio = dominados and self._elimina_dominados(restantes, presentes, protegidos, elimina)
+        return np.flatnonzero(presentes)
+
+    def _elimina_dominados(self, restantes, presentes, protegidos, elimina):
+        """Elimina cada vértice dominado por otro vértice no adyacente
+
+        Returns:
+            bool: Si se eliminó algún vértice
+        """
+        eliminado = False
+        orden = sorted((v for v in range(self.grafica.vertices) if presentes[v] and v not in protegidos),
+                       key=lambda v: len(restantes[v]))
+        for u in orden:
+            vecinos = restantes[u]
+            if not presentes[u] or not vecinos:
+                continue
+            # los candidatos a dominar a u son vecinos de su vecino de menor grado
+            pivote = min(vecinos, key=lambda w: len(restantes[w]))
+            for v in restantes[pivote]:
+                if v != u and v not in vecinos and len(restantes[v]) >= len(vecinos) and vecinos <= restantes[v]:
+                    elimina(u, v)
+                    eliminado = True
+                    break
+        return eliminado
+
+    def expande(self, colores):
+        """Construye la coloración de la gráfica original a partir de una
+            coloración de la reducida. Los vértices eliminados por grado
+            toman, de preferencia, un color ya usado que no tenga ningún
+            vecino; los dominados toman el color de su dominante.
+
+        Args:
+            colores (array(int)): Coloración de la gráfica reducida
+
+        Returns:
+            array(int): Coloración de la gráfica original
+        """
+        completa = np.zeros(self.grafica.vertices, dtype=np.int64)
+        completa[self.vertices] = colores
+        completa = completa.tolist()
+        usados = set(completa) - {0}
+        for v, dominante in reversed(self.eliminados):
+            if dominante >= 0:
+                completa[v] = completa[dominante]
+                continue
+            ocupados = {completa[w] for w in self.vecinos[v]}
+            libres = usados - ocupados
+            if libres:
+                color = min(libres)
+            else:
+                color = 1
+                while color in ocupados:
+                    color += 1
+                usados.add(color)
+            completa[v] = color
+        return np.array(completa, dtype=np.int64)
+
+    def evaluacion_minima(self):
+        """Cota inferior de la evaluación de cualquier coloración (dos veces
+            los conflictos más los lazos y los colores usados): el clique
+            necesita la cota de colores o un conflicto por cada color que falte
+
+        Returns:
+            int: Cota inferior de la evaluación
+        """
+        return self.grafica.lazos + self.cota
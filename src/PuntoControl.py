@@ -0,0 +1,81 @@
+import os
+import pickle
+import time
+
+class PuntoControl:
+    """Guarda periódicamente el estado de una búsqueda para poder reanudarla.
+
+    El estado (población o solución actual, mejor encontrado, estadísticas y
+    contador de iteraciones) se guarda con pickle junto con el estado del
+    generador de la búsqueda, así que al reanudar la búsqueda continúa
+    exactamente igual que si no se hubiera interrumpido. Cada escritura va a
+    un archivo temporal que después reemplaza al anterior con os.replace,
+    por lo que nunca queda un punto de control a medio escribir.
+    """
+
+    VERSION = 4
+
+    def __init__(self, ruta, segundos=5.0, reanudar=False):
+        self.ruta = ruta
+        self.segundos = segundos
+        self.ultimo = time.perf_counter()
+        self.estado = None
+        if reanudar and os.path.exists(ruta):
+            with open(ruta, 'rb') as archivo:
+                self.estado = pickle.load(archivo)
+            if self.estado.get("version") != self.VERSION:
+                raise ValueError(f"{ruta}: versión de punto de control no soportada")
+
+    def reanuda(self, busqueda, generador):
+        """Regresa el estado guardado de una búsqueda y restaura el estado de
+            su generador aleatorio. Sólo se puede reanudar una vez.
+
+        Args:
+            busqueda (str): Nombre de la búsqueda que lo pide
+            generador (Generator): Generador de la búsqueda, se restaura en su lugar
+
+        Raises:
+            ValueError: Si el punto de control es de otra búsqueda
+
+        Returns:
+            dict: Estado guardado o None si no hay nada que reanudar
+        """
+        if self.estado is None:
+            return None
+        estado, self.estado = self.estado, None
+        if estado["busqueda"] != busqueda:
+            raise ValueError(f"{self.ruta}: el punto de control es de la búsqueda {estado['busqueda']}, no de {busqueda}")
+        generador.bit_generator.state = estado["generador"]
+        return estado["datos"]
+
+    def revisa(self, busqueda, datos, generador):
+        """Guarda el estado si ya pasaron los segundos indicados desde el último guardado
+
+        Args:
+            busqueda (str): Nombre de la búsqueda
+            datos (callable): Función sin argumentos que regresa el estado como diccionario;
+                sólo se llama cuando toca guardar
+            generador (Generator): Generador de la búsqueda
+        """
+        if time.perf_counter() - self.ultimo >= self.segundos:
+            self.guarda(busqueda, datos(), generador)
+
+    def guarda(self, busqueda, datos, generador):
+        """Escribe el punto de control de forma atómica
+
+        Args:
+            busqueda (str): Nombre de la búsqueda
+            datos (dict): Estado de la búsqueda
+            generador (Generator): Generador de la búsqueda
+        """
+        estado = {"version": self.VERSION, "busqueda": busqueda, "datos": datos,
+                  "generador": generador.bit_generator.state}
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        try:
+            with open(temporal, 'wb') as salida:
+                pickle.dump(estado, salida, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, self.ruta)
+        finally:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+        self.ultimo = time.perf_counter()
@@ -0,0 +1,120 @@
+import numpy as np
+
+class Seleccion:
+    """Esquemas de selección de padres para minimización. Cada método
+    recibe las aptitudes de toda la generación y regresa de una vez los
+    índices de todos los padres que se necesitan. El generador puede ser un
+    numpy.random.Generator o una semilla; si es None se crea uno nuevo.
+    """
+
+    # peso del peor individuo, relativo al rango, cuando hay aptitudes no positivas
+    MARGEN_PESOS = 0.1
+
+    @staticmethod
+    def pesos(aptitudes):
+        """Calcula los pesos de selección proporcional: 1/f si todas las
+            aptitudes son positivas; si hay ceros o negativos el peso es
+            (max - f) + MARGEN_PESOS * rango, así que el mejor individuo pesa a
+            lo más 1 + 1/MARGEN_PESOS veces lo que el peor. Las aptitudes no
+            finitas reciben peso cero.
+
+        Args:
+            aptitudes (array(float)): Aptitud de cada individuo
+
+        Returns:
+            array(float): Peso de cada individuo
+        """
+        aptitudes = np.asarray(aptitudes, dtype=np.float64)
+        finitas = np.isfinite(aptitudes)
+        if not finitas.any():
+            return np.ones_like(aptitudes)
+        pesos = np.zeros_like(aptitudes)
+        minimo = aptitudes[finitas].min()
+        if minimo <= 0:
+            maximo = aptitudes[finitas].max()
+            rango = maximo - minimo
+            if rango == 0:
+                pesos[finitas] = 1.0
+            else:
+                pesos[finitas] = maximo - aptitudes[finitas] + Seleccion.MARGEN_PESOS * rango
+            return pesos
+        pesos[finitas] = 1 / aptitudes[finitas]
+        return pesos
+
+    @staticmethod
+    def ruleta(aptitudes, cantidad, generador=None):
+        """Selección por ruleta: construye el arreglo acumulado una vez
+            y ubica cada punto con búsqueda binaria, O(log n) por padre
+
+        Args:
+            aptitudes (array(float)): Aptitud de cada individuo
+            cantidad (int): Número de padres a seleccionar
+            generador (Generator, optional): Generador de números aleatorios. Defaults to None.
+
+        Returns:
+            array(int): Índices de los padres
+        """
+        acumulado = np.cumsum(Seleccion.pesos(aptitudes))
+        puntos = np.random.default_rng(generador).uniform(0, acumulado[-1], size=cantidad)
+        return np.minimum(np.searchsorted(acumulado, puntos, side='right'), len(acumulado) - 1)
+
+    @staticmethod
+    def universal_estocastico(aptitudes, cantidad, generador=None):
+        """Muestreo universal estocástico: un solo número aleatorio y
+            cantidad punteros equiespaciados sobre el arreglo acumulado
+
+        Args:
+            aptitudes (array(float)): Aptitud de cada individuo
+            cantidad (int): Número de padres a seleccionar
+            generador (Generator, optional): Generador de números aleatorios. Defaults to None.
+
+        Returns:
+            array(int): Índices de los padres en orden aleatorio
+        """
+        acumulado = np.cumsum(Seleccion.pesos(aptitudes))
+        generador = np.random.default_rng(generador)
+        paso = acumulado[-1] / cantidad
+        puntos = generador.uniform(0, paso) + paso * np.arange(cantidad)
+        indices = np.minimum(np.searchsorted(acumulado, puntos, side='right'), len(acumulado) - 1)
+        generador.shuffle(indices)
+        return indices
+
+    @staticmethod
+    def torneo(aptitudes, cantidad, tamanio=2, generador=None):
+        """Selección por torneo: cada padre es el mejor de tamanio
+            individuos elegidos al azar
+
+        Args:
+            aptitudes (array(float)): Aptitud de cada individuo
+            cantidad (int): Número de padres a seleccionar
+            tamanio (int, optional): Tamaño del torneo. Defaults to 2.
+            generador (Generator, optional): Generador de números aleatorios. Defaults to None.
+
+        Returns:
+            array(int): Índices de los padres
+        """
+        aptitudes = np.asarray(aptitudes, dtype=np.float64)
+        competidores = np.random.default_rng(generador).integers(0, len(aptitudes), size=(cantidad, tamanio))
+        ganadores = np.argmin(aptitudes[competidores], axis=1)
+        return competidores[np.arange(cantidad), ganadores]
+
+    @staticmethod
+    def selecciona(esquema, aptitudes, cantidad, generador=None):
+        """Selecciona padres con el esquema indicado
+
+        Args:
+            esquema (str): ruleta, universal o torneo
+            aptitudes (array(float)): Aptitud de cada individuo
+            cantidad (int): Número de padres a seleccionar
+            generador (Generator, optional): Generador de números aleatorios. Defaults to None.
+
+        Returns:
+            array(int): Índices de los padres
+        """
+        if esquema == "ruleta":
+            return Seleccion.ruleta(aptitudes, cantidad, generador)
+        elif esquema == "universal":
+            return Seleccion.universal_estocastico(aptitudes, cantidad, generador)
+        elif esquema == "torneo":
+            return Seleccion.torneo(aptitudes, cantidad, generador=generador)
+        raise ValueError(f"Esquema de selección desconocido: {esquema}")
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from BusquedaTabu import BusquedaTabu
+from Coloracion import Coloracion
+from CriterioParo import CriterioParo
+from Grafica import Grafica
+from Instrumentacion import Instrumentacion
+
+GRAFO = os.path.join(os.path.dirname(__file__), "..", "Grafo9.txt")
+ITERACIONES = 300000
+
+
+def coloracion(criterio):
+    problema = Coloracion.leer_archivo(GRAFO, usar_cache=False)
+    problema.asigna_generador(1)
+    problema.criterio = criterio
+    return problema
+
+
+def test_tiempo_detiene_tabu_a_mitad_de_fase():
+    problema = coloracion(CriterioParo(segundos=0.5))
+    problema.instrumentacion = Instrumentacion()
+    mejor, evaluacion, _, _ = problema.busqueda_tabu(ITERACIONES)
+    assert problema.criterio.motivo == "tiempo"
+    assert problema.instrumentacion.contadores["movimientos_aceptados"] < ITERACIONES
+    assert evaluacion == problema.funcion_evaluacion(mejor)
+
+
+def test_evaluaciones_detienen_tabu_a_mitad_de_fase():
+    criterio = CriterioParo(evaluaciones=20000)
+    problema = coloracion(criterio)
+    problema.busqueda_tabu(ITERACIONES)
+    assert criterio.motivo == "evaluaciones"
+    # entre revisiones hay a lo más un bloque de movimientos y cada uno
+    # prueba (k - 1) colores de cada vértice en conflicto
+    k = int(problema.grafica.grados().max()) + 1
+    assert 20000 <= criterio.realizadas <= 20000 + BusquedaTabu.BLOQUE_ALEATORIOS * problema.vertices * (k - 1)
+
+
+def test_sin_mejora_detiene_tabu_y_registra_mejoras():
+    criterio = CriterioParo(sin_mejora=3000)
+    problema = coloracion(criterio)
+    _, evaluacion, _, _ = problema.busqueda_tabu(ITERACIONES)
+    assert criterio.motivo == "sin_mejora"
+    assert criterio.mejor == evaluacion
+
+
+def test_tabu_en_grafica_bipartita_se_detiene_en_dos_colores():
+    camino = Grafica.desde_aristas(10, np.arange(9), np.arange(1, 10))
+    for semilla in range(5):
+        problema = Coloracion.desde_grafica(camino)
+        problema.asigna_generador(semilla)
+        mejor, evaluacion, _, _ = problema.busqueda_tabu(200)
+        assert evaluacion == 2
+        assert evaluacion == problema.funcion_evaluacion(mejor)
+
+
+def test_busca_sin_movimientos_con_un_color():
+    camino = Grafica.desde_aristas(4, np.arange(3), np.arange(1, 4))
+    colores, conflictos, realizadas, probados = BusquedaTabu(camino, generador=0).busca(np.zeros(4, dtype=np.int64), 1, 100)
+    assert conflictos == 3 and realizadas == probados == 0
+
+
+def test_busca_mantiene_los_conflictos_sin_recorrer_la_grafica():
+    generador = np.random.default_rng(3)
+    origen, destino = generador.integers(0, 300, (2, 3000))
+    grafica = Grafica.desde_aristas(300, origen, destino)
+    tabu = BusquedaTabu(grafica, generador=0)
+    for k in (6, 9, 12):
+        colores, conflictos, _, _ = tabu.busca(generador.integers(0, k, 300), k, 3000)
+        assert conflictos == np.count_nonzero(colores[grafica.u] == colores[grafica.v])
+
+
+def test_tabu_cuenta_vecinos_probados_y_movimientos_aceptados():
+    problema = coloracion(CriterioParo())
+    problema.instrumentacion = Instrumentacion()
+    problema.busqueda_tabu(3000)
+    contadores = problema.instrumentacion.contadores
+    assert contadores["movimientos_aceptados"] <= 3000
+    assert contadores["movimientos_probados"] + contadores["evaluaciones"] == problema.criterio.realizadas
+    assert contadores["movimientos_probados"] > contadores["movimientos_aceptados"]
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from Coloracion import Coloracion
+from CriterioParo import CriterioParo
+from Islas import ModeloIslas
+
+GRAFO = os.path.join(os.path.dirname(__file__), "..", "Grafo5.txt")
+
+
+def coloracion(criterio=None):
+    problema = Coloracion.leer_archivo(GRAFO, usar_cache=False)
+    problema.asigna_generador(0)
+    if criterio is not None:
+        problema.criterio = criterio
+    return problema
+
+
+@pytest.mark.parametrize("criterio", [CriterioParo(evaluaciones=0), CriterioParo(segundos=0)])
+def test_genetico_con_criterio_ya_cumplido_evalua_una_generacion(criterio):
+    reducida = coloracion(criterio).reduce()
+    mejor, evaluacion, _, _ = reducida.algoritmo_genetico(10, 100)
+    assert evaluacion == reducida.funcion_evaluacion(mejor)
+    original, evaluacion = reducida.solucion_original(mejor, evaluacion)
+    assert evaluacion == reducida.original.funcion_evaluacion(original)
+
+
+@pytest.mark.parametrize("criterio", [CriterioParo(evaluaciones=0), CriterioParo(segundos=0)])
+def test_islas_con_criterio_ya_cumplido_hacen_una_epoca(criterio):
+    problema = coloracion(criterio)
+    mejor, evaluacion, _, _ = ModeloIslas(problema, islas=2, intervalo_migracion=5, procesos=1).ejecuta(10, 100)
+    assert criterio.realizadas == 2 * 10 * (5 + 1)
+    assert evaluacion == problema.funcion_evaluacion(mejor)
+
+
+def test_genetico_usa_la_cache_sin_cambiar_el_resultado():
+    sin_cache = coloracion().algoritmo_genetico(20, 50)
+    problema = coloracion()
+    problema.activa_cache(10000)
+    con_cache = problema.algoritmo_genetico(20, 50)
+    assert problema.cache.aciertos > 0
+    assert problema.cache.aciertos + problema.cache.fallos == 20 * 50
+    assert (con_cache[0] == sin_cache[0]).all() and con_cache[1:] == sin_cache[1:]
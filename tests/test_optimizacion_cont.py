@@ -0,0 +1,31 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from Optimizacion_Cont import AlgoritmoGenetico, AlgoritmoGeneticoVectorizado, ejecutar_corrida, dominios, funciones
+
+
+@pytest.mark.parametrize("vectorizado", [False, True])
+def test_promedio_es_la_aptitud_media_de_las_generaciones(vectorizado):
+    corrida = ejecutar_corrida("sphere", funciones["sphere"], dominios["sphere"], 0, 7, vectorizado=vectorizado)
+    assert corrida["mejor"] <= corrida["promedio"] <= corrida["peor"]
+
+
+@pytest.mark.parametrize("clase", [AlgoritmoGenetico, AlgoritmoGeneticoVectorizado])
+def test_promedio_coincide_con_las_medias_por_generacion(clase):
+    medias = []
+
+    class Registro(clase):
+        def evaluar_poblacion(self, poblacion):
+            evaluaciones = super().evaluar_poblacion(poblacion)
+            aptitudes = evaluaciones if isinstance(evaluaciones, np.ndarray) else [e for _, e in evaluaciones]
+            medias.append(float(np.mean(aptitudes)))
+            return evaluaciones
+
+    ag = Registro(funciones["sphere"], dominios["sphere"], num_generaciones=30, generador=3)
+    _, _, _, _, promedio = ag.ejecutar()
+    assert promedio == pytest.approx(np.mean(medias))
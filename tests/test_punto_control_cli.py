@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+GRAFO = os.path.join(os.path.dirname(__file__), "..", "Grafo5.txt")
+
+
+def ejecuta(programa, *argumentos):
+    return subprocess.run([sys.executable, os.path.join(SRC, programa), *argumentos],
+                          capture_output=True, text=True, cwd=SRC)
+
+
+@pytest.mark.parametrize("busqueda", ["aleatoria", "tabu", "islas"])
+def test_checkpoint_en_busqueda_sin_soporte_es_un_error(busqueda, tmp_path):
+    resultado = ejecuta("Coloracion.py", GRAFO, busqueda, "10", "--checkpoint", str(tmp_path / "punto.pkl"), "--resume")
+    assert resultado.returncode == 2
+    assert "--checkpoint" in resultado.stderr
+    assert not (tmp_path / "punto.pkl").exists()
+
+
+def test_checkpoint_en_experimentos_es_un_error(tmp_path):
+    resultado = ejecuta("Optimizacion_Cont.py", "experimentos", "--checkpoint", str(tmp_path / "punto.pkl"))
+    assert resultado.returncode == 2
+    assert "--checkpoint" in resultado.stderr
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from Seleccion import Seleccion
+
+
+def test_pesos_con_aptitudes_no_positivas_estan_acotados():
+    for aptitudes in ([0, 1, 10], [-5, -4, 3, 100], [-1e9, 0, 1e-3]):
+        pesos = Seleccion.pesos(aptitudes)
+        assert np.argmax(pesos) == np.argmin(aptitudes)
+        assert pesos.max() / pesos.min() <= 1 + 1 / Seleccion.MARGEN_PESOS + 1e-9
+
+
+def test_pesos_iguales_y_no_finitos():
+    assert np.array_equal(Seleccion.pesos([0, 0, 0]), [1, 1, 1])
+    pesos = Seleccion.pesos([0, np.inf, 2])
+    assert pesos[1] == 0 and pesos[0] > pesos[2] > 0
+
+
+def test_ruleta_no_colapsa_en_el_mejor():
+    padres = Seleccion.ruleta(np.arange(100.0), 10000, generador=0)
+    assert np.count_nonzero(padres == 0) < 1000
+    assert np.unique(padres).size > 50